@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 import structlog
 
@@ -46,7 +46,8 @@ async def create_email_template(
     """
     try:
         service = EmailTemplateService(session)
-        template = await service.create_template(template_data)
+        async with session.begin():
+            template = await service.create_template(template_data)
         
         logger.info("Email template created via API", 
                    template_id=template.id,
@@ -55,7 +56,7 @@ async def create_email_template(
         
         return EmailTemplateCreatedResponse(
             message=f"Email template '{template.identifier}' version {template.version} created successfully",
-            template=EmailTemplateResponse.from_orm(template)
+            template=EmailTemplateResponse.from_template(template)
         )
         
     except ValueError as e:
@@ -92,7 +93,7 @@ async def list_email_templates(
         service = EmailTemplateService(session)
         templates, total = await service.get_all_templates(skip=skip, limit=limit)
         
-        template_responses = [EmailTemplateResponse.from_orm(t) for t in templates]
+        template_responses = [EmailTemplateResponse.from_template(t) for t in templates]
         
         total_pages = (total + limit - 1) // limit  # Ceiling division
         current_page = (skip // limit) + 1
@@ -116,7 +117,7 @@ async def list_email_templates(
 @router.get("/latest", response_model=List[EmailTemplateSummary])
 async def get_latest_templates_summary(
     session: AsyncSession = Depends(get_session)
-) -> List[EmailTemplateSummary]:
+) -> Response:
     """
     Get the latest version for each email template identifier in summary format.
     
@@ -125,14 +126,15 @@ async def get_latest_templates_summary(
     a quick overview of all available templates.
     
     Returns:
-        List[EmailTemplateSummary]: List of template summaries with identifier and data
+        Response: JSON list of template summaries with identifier and data,
+            served from the payloads stored with each version
     """
     try:
         service = EmailTemplateService(session)
-        summaries = await service.get_latest_templates_summary()
+        summaries, count = await service.get_latest_templates_summary_json()
         
-        logger.info("Retrieved latest templates summary", count=len(summaries))
-        return summaries
+        logger.info("Retrieved latest templates summary", count=count)
+        return Response(content=summaries, media_type="application/json")
         
     except Exception as e:
         logger.error("Error retrieving latest templates summary", error=str(e))
@@ -166,7 +168,7 @@ async def get_email_template(
                 detail=f"Email template '{identifier}' not found"
             )
         
-        return EmailTemplateResponse.from_orm(template)
+        return EmailTemplateResponse.from_template(template)
         
     except HTTPException:
         raise
@@ -247,7 +249,7 @@ async def get_template_version(
                 detail=f"Email template '{identifier}' version {version} not found"
             )
         
-        return EmailTemplateResponse.from_orm(template)
+        return EmailTemplateResponse.from_template(template)
         
     except HTTPException:
         raise
@@ -283,7 +285,8 @@ async def update_email_template(
     """
     try:
         service = EmailTemplateService(session)
-        template, previous_version = await service.update_template(identifier, update_data)
+        async with session.begin():
+            template, previous_version = await service.update_template(identifier, update_data)
         
         logger.info("Email template updated via API", 
                    template_id=template.id,
@@ -293,7 +296,7 @@ async def update_email_template(
         
         return EmailTemplateUpdatedResponse(
             message=f"Email template '{identifier}' updated to version {template.version}",
-            template=EmailTemplateResponse.from_orm(template),
+            template=EmailTemplateResponse.from_template(template),
             previous_version=previous_version
         )
         
@@ -333,7 +336,8 @@ async def activate_template_version(
     """
     try:
         service = EmailTemplateService(session)
-        template, previous_version = await service.activate_version(identifier, version)
+        async with session.begin():
+            template, previous_version = await service.activate_version(identifier, version)
         
         if not template:
             raise HTTPException(
@@ -348,7 +352,7 @@ async def activate_template_version(
         
         return EmailTemplateActivatedResponse(
             message=f"Email template '{identifier}' version {version} activated successfully",
-            template=EmailTemplateResponse.from_orm(template),
+            template=EmailTemplateResponse.from_template(template),
             previous_active_version=previous_version
         )
         
@@ -387,7 +391,8 @@ async def delete_email_template(
     """
     try:
         service = EmailTemplateService(session)
-        success, versions_deleted = await service.delete_template(identifier)
+        async with session.begin():
+            success, versions_deleted = await service.delete_template(identifier)
         
         if not success:
             raise HTTPException(
@@ -1,15 +1,17 @@
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Header, status
+from fastapi.responses import ORJSONResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 import structlog
 
 from app.database import get_session
-from app.services.escalation_service import EscalationService
+from app.services.escalation_service import EscalationService, ESCALATION_TEMPLATE_PREFIX
 from app.services.email_template_service import EmailTemplateService
 from app.external.claude_client import claude_client
 from app.schemas.escalation import (
     EscalationRequest,
     EscalationBatchResponse,
+    EscalationBatchResponseSoA,
     EscalationPreviewRequest,
     EscalationPreviewResponse,
     EscalationStatsRequest,
@@ -24,6 +26,9 @@ from app.schemas.csv_import import ContactReadyClient
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Accept header value that selects the columnar batch response
+SOA_MEDIA_TYPE = "application/x-soa+json"
+
 
 @router.post("/process", 
             response_model=EscalationBatchResponse,
@@ -31,6 +36,7 @@ router = APIRouter()
             description="Generate and send personalized escalation emails for a batch of contact-ready clients")
 async def process_escalation_batch(
     request: EscalationRequest,
+    accept: Optional[str] = Header(None),
     session: AsyncSession = Depends(get_session)
 ) -> EscalationBatchResponse:
     """
@@ -57,8 +63,12 @@ async def process_escalation_batch(
     - Detailed email statistics per account (invoice details, aging summaries)
     - Processing metrics and error information
     
+    Sending "Accept: application/x-soa+json" returns the same data in columnar
+    form (EscalationBatchResponseSoA), which serializes faster for large batches.
+    
     Args:
         request: Escalation request containing contact data and sending options
+        accept: Accept header used to negotiate the columnar response
         
     Returns:
         EscalationBatchResponse: Comprehensive batch processing results with email statistics
@@ -79,6 +89,13 @@ async def process_escalation_batch(
                    preview_only=request.preview_only,
                    send_emails=request.send_emails)
         
+        if accept and SOA_MEDIA_TYPE in accept:
+            soa_result = EscalationBatchResponseSoA.from_aos(result)
+            return ORJSONResponse(
+                content=soa_result.model_dump(mode="json"),
+                media_type=SOA_MEDIA_TYPE
+            )
+        
         return result
         
     except Exception as e:
@@ -125,7 +142,7 @@ async def preview_escalation_emails(
         batch_result = await escalation_service.process_escalation_batch(escalation_request)
         
         # Analyze the data for summary
-        stats = await escalation_service.analyze_escalation_needs(request.contact_ready_clients)
+        stats, _ = await escalation_service.analyze_escalation_needs(request.contact_ready_clients)
         
         # Build template usage statistics
         template_usage = {}
@@ -194,18 +211,9 @@ async def analyze_escalation_requirements(
                    contact_count=len(request.contact_ready_clients))
         
         escalation_service = EscalationService(session)
-        stats = await escalation_service.analyze_escalation_needs(request.contact_ready_clients)
-        
-        # Build degree breakdown with account names
-        degree_breakdown = {}
-        for contact in request.contact_ready_clients:
-            if contact.invoice_aging_snapshots:
-                degree_info = escalation_service._calculate_escalation_degree(contact.invoice_aging_snapshots)
-                degree = degree_info.degree
-                
-                if degree not in degree_breakdown:
-                    degree_breakdown[degree] = []
-                degree_breakdown[degree].append(contact.account_name)
+        stats, degree_breakdown = await escalation_service.analyze_escalation_needs(
+            request.contact_ready_clients
+        )
         
         # Generate recommendations
         recommendations = []
@@ -268,7 +276,7 @@ async def list_escalation_templates(
         logger.info("Retrieving escalation templates")
         
         template_service = EmailTemplateService(session)
-        all_templates = await template_service.get_latest_templates_summary()
+        all_templates = await template_service.get_latest_templates_summary(ESCALATION_TEMPLATE_PREFIX)
         
         # Filter for escalation templates and build template info
         escalation_templates = []
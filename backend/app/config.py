@@ -1,4 +1,5 @@
 # app/config.py
+from functools import lru_cache
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -45,5 +46,6 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "ignore"
 
+@lru_cache
 def get_settings() -> Settings:
     return Settings()
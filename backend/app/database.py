@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 import logging
 
+import orjson
+
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,17 @@ if settings.environment == "local":
 else:
     db_url = f"postgresql+asyncpg://{settings.db_user}:{settings.db_password}@/{settings.db_name}?host=/cloudsql/{settings.db_connection_name}"
 
-engine = create_async_engine(db_url)
+
+def _orjson_serializer(obj: Any) -> str:
+    """Serialize JSON column values with orjson; asyncpg expects text for JSON binds."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_async_engine(
+    db_url,
+    json_serializer=_orjson_serializer,
+    json_deserializer=orjson.loads
+)
 
 async_session_maker = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
@@ -1,11 +1,13 @@
 import httpx
 import json
+import orjson
 import structlog
 from typing import List, Dict, Any, Optional
 from fastapi import HTTPException
 from datetime import datetime
 
 from app.config import get_settings
+from app.schemas._encoders import orjson_default
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -153,7 +155,7 @@ The response must be valid JSON that can be parsed directly. Do not include any
 Current date: {datetime.now().strftime("%B %d, %Y")}
 
 Contact Data:
-{json.dumps(contact_data, indent=2, default=str)}
+{orjson.dumps(contact_data, default=orjson_default, option=orjson.OPT_INDENT_2).decode()}
 
 Generate personalized escalation emails following the rules and format specified in the system prompt."""
         
@@ -1,3 +1,4 @@
+import time
 import aiosmtplib
 import structlog
 from email.mime.text import MIMEText
@@ -5,7 +6,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 from email.utils import formataddr
 from fastapi import HTTPException
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from app.config import get_settings
@@ -13,6 +14,12 @@ from app.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Maximum number of idle SMTP connections kept open for reuse between sends
+SMTP_POOL_SIZE = 10
+
+# Idle connections older than this are closed rather than reused, before the server drops them
+SMTP_IDLE_TIMEOUT_SECONDS = 30.0
+
 
 class EmailAttachment:
     """Represents an email attachment"""
@@ -33,6 +40,8 @@ class SMTPEmailClient:
         self.smtp_password = settings.smtp_password or ""
         self.from_email = settings.from_email or "noreply@example.com"
         self.from_name = settings.from_name or "FastAPI Template"
+        # Authenticated connections waiting for reuse, with the time they went idle
+        self._idle_connections: List[Tuple[aiosmtplib.SMTP, float]] = []
 
     async def send_email(
         self,
@@ -55,7 +64,7 @@ class SMTPEmailClient:
             reply_to: Reply-to email address (optional)
             
         Returns:
-            dict: Email sending result with status and message_id
+            dict: Email sending result with status, message_id and sent_at (UTC datetime)
         """
         try:
             message = await self._create_message(
@@ -81,7 +90,7 @@ class SMTPEmailClient:
                 "status": "sent",
                 "message_id": result.get("message_id"),
                 "to_email": to_email,
-                "sent_at": datetime.utcnow().isoformat()
+                "sent_at": datetime.utcnow()
             }
             
         except Exception as e:
@@ -95,7 +104,7 @@ class SMTPEmailClient:
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to send email: {str(e)}"
-            )
+            ) from e
 
     async def send_template_email(
         self,
@@ -203,22 +212,24 @@ class SMTPEmailClient:
     async def _send_smtp_message(self, message: MIMEMultipart) -> dict:
         """Send email message via SMTP"""
         try:
-            # Create SMTP client
-            smtp_client = aiosmtplib.SMTP(
-                hostname=self.smtp_host,
-                port=self.smtp_port,
-                use_tls=True
-            )
-            
-            # Connect and authenticate
-            await smtp_client.connect()
-            await smtp_client.login(self.smtp_username, self.smtp_password)
+            smtp_client, reused = await self._acquire_connection()
             
-            # Send message
-            result = await smtp_client.send_message(message)
+            try:
+                try:
+                    result = await smtp_client.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    if not reused:
+                        raise
+                    # Pooled session was dropped by the server; retry once on a fresh one
+                    smtp_client.close()
+                    smtp_client = await self._open_connection()
+                    result = await smtp_client.send_message(message)
+            except Exception:
+                await self._close_connection(smtp_client)
+                raise
             
-            # Close connection
-            await smtp_client.quit()
+            # Keep the connection for the next send
+            await self._release_connection(smtp_client)
             
             logger.info(
                 "SMTP message sent successfully",
@@ -241,6 +252,60 @@ class SMTPEmailClient:
             )
             raise
 
+    async def _open_connection(self) -> aiosmtplib.SMTP:
+        """Open and authenticate a new SMTP connection"""
+        smtp_client = aiosmtplib.SMTP(
+            hostname=self.smtp_host,
+            port=self.smtp_port,
+            use_tls=True
+        )
+        
+        await smtp_client.connect()
+        try:
+            await smtp_client.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            smtp_client.close()
+            raise
+        
+        return smtp_client
+
+    async def _acquire_connection(self) -> Tuple[aiosmtplib.SMTP, bool]:
+        """
+        Take a live idle connection from the pool, or open a new one.
+        
+        Returns:
+            Tuple: (smtp_client, reused) - the connection and whether it came from the pool
+        """
+        now = time.monotonic()
+        while self._idle_connections:
+            smtp_client, idle_since = self._idle_connections.pop()
+            if smtp_client.is_connected and now - idle_since < SMTP_IDLE_TIMEOUT_SECONDS:
+                return smtp_client, True
+            await self._close_connection(smtp_client)
+        
+        return await self._open_connection(), False
+
+    async def _release_connection(self, smtp_client: aiosmtplib.SMTP):
+        """Return a connection to the pool, closing it if the pool is full"""
+        if smtp_client.is_connected and len(self._idle_connections) < SMTP_POOL_SIZE:
+            self._idle_connections.append((smtp_client, time.monotonic()))
+        else:
+            await self._close_connection(smtp_client)
+
+    async def _close_connection(self, smtp_client: aiosmtplib.SMTP):
+        """Close an SMTP connection, tolerating sessions the server already dropped"""
+        try:
+            if smtp_client.is_connected:
+                await smtp_client.quit()
+        except Exception:
+            smtp_client.close()
+
+    async def close(self):
+        """Close all idle pooled SMTP connections"""
+        idle_connections, self._idle_connections = self._idle_connections, []
+        for smtp_client, _ in idle_connections:
+            await self._close_connection(smtp_client)
+
     async def _get_template_content(self, template_name: str, context: dict) -> dict:
         """
         Get template content (placeholder implementation)
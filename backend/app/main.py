@@ -3,11 +3,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from app.config import get_settings
 from app.database import create_db_and_tables
+from app.external.email_client import email_client
 from app.api.v1 import api_router
 
 # Configure structured logging
@@ -27,6 +28,7 @@ structlog.configure(
 )
 
 logger = structlog.get_logger()
+settings = get_settings()
 
 
 @asynccontextmanager
@@ -35,7 +37,6 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application")
 
-    settings = get_settings()
     if settings.environment == "local":
         await create_db_and_tables()
         logger.info("Database tables created (development mode)")
@@ -46,17 +47,17 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down application")
+    await email_client.close()
 
 
 def create_application() -> FastAPI:
     """Create FastAPI application with all configurations."""
-    settings = get_settings()
-
     app = FastAPI(
         title=settings.project_name,
         description="Fineman West API",
         docs_url=None if settings.environment == "production" else "/docs",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Security middleware
@@ -74,7 +75,7 @@ def create_application() -> FastAPI:
     # Exception handlers
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"error": exc.detail},
         )
@@ -82,7 +83,7 @@ def create_application() -> FastAPI:
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         logger.error("Unhandled exception", exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={"error": "Internal server error"},
         )
@@ -90,10 +91,12 @@ def create_application() -> FastAPI:
     # Include API routes
     app.include_router(api_router, prefix="/api/v1")
 
-    # Health check
+    # Health check (payload is static, build it once)
+    health_payload = {"status": "healthy", "service": settings.project_name}
+
     @app.get("/health")
     async def health_check():
-        return {"status": "healthy", "service": settings.project_name}
+        return health_payload
 
     return app
 
@@ -107,6 +110,6 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=get_settings().environment == "local",
+        reload=settings.environment == "local",
         log_level="info",
     )
@@ -14,7 +14,7 @@ class ContactBase(SQLModel):
     account_id: str = Field(foreign_key="accounts.id", description="Foreign key to Account")
     first_name: str = Field(description="Contact's first name")
     last_name: str = Field(description="Contact's last name")
-    email: EmailStr = Field(index=True, description="Contact's email address")
+    email: str = Field(index=True, description="Contact's email address")
     phone: Optional[str] = Field(default=None, description="Contact's phone number")
     is_billing_contact: bool = Field(default=False, description="Whether this contact handles billing")
 
@@ -30,7 +30,8 @@ class Contact(UUIDMixin, TimestampMixin, ContactBase, table=True):
 
 class ContactCreate(ContactBase):
     """Contact creation schema."""
-    pass
+    
+    email: EmailStr = Field(description="Contact's email address")
 
 
 class ContactRead(ContactBase):
@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON, Boolean, String, Integer, Index, UniqueConstraint
+from sqlalchemy import JSON, Boolean, String, Integer, Text, Index, UniqueConstraint, text
 
 from app.models.base import UUIDMixin, TimestampMixin
 
@@ -31,9 +31,22 @@ class EmailTemplate(UUIDMixin, TimestampMixin, EmailTemplateBase, table=True):
     
     __tablename__ = "email_templates"
     
+    summary_json: Optional[str] = Field(
+        default=None,
+        sa_column=Column(Text, nullable=True),
+        description="Pre-serialized EmailTemplateSummary payload written with each version"
+    )
+    
     __table_args__ = (
         UniqueConstraint('identifier', 'version', name='uq_email_template_identifier_version'),
         Index('ix_email_templates_identifier_active', 'identifier', 'is_active'),
+        # Partial index serving active-version lookups ordered by newest version
+        Index(
+            'ix_email_templates_identifier_version_active',
+            'identifier',
+            text('version DESC'),
+            postgresql_where=text('is_active')
+        ),
     )
 
 
@@ -2,7 +2,7 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 from sqlmodel import SQLModel, Field, Relationship, Column
-from sqlalchemy import DECIMAL
+from sqlalchemy import DECIMAL, Index, text
 
 from app.models.base import UUIDMixin, TimestampMixin
 
@@ -42,6 +42,15 @@ class InvoiceAgingSnapshot(UUIDMixin, TimestampMixin, InvoiceAgingSnapshotBase,
     
     __tablename__ = "invoice_aging_snapshots"
     
+    __table_args__ = (
+        # Serves per-invoice snapshot lookups and latest-snapshot-first ordering
+        Index(
+            'ix_invoice_aging_snapshots_invoice_id_snapshot_date',
+            'invoice_id',
+            text('snapshot_date DESC')
+        ),
+    )
+    
     # Relationships
     invoice: "Invoice" = Relationship(back_populates="aging_snapshots")
 
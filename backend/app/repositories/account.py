@@ -1,5 +1,6 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 from sqlmodel import select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -21,6 +22,15 @@ class AccountRepository(BaseRepository[Account]):
         )
         return result.scalars().first()
 
+    async def get_by_client_ids(self, client_ids: Set[str]) -> Dict[str, Account]:
+        """Get accounts for many client_ids in one query, keyed by client_id."""
+        if not client_ids:
+            return {}
+        result = await self.session.execute(
+            select(Account).where(Account.client_id.in_(client_ids))
+        )
+        return {account.client_id: account for account in result.scalars().all()}
+
     async def create_with_contact(
         self, 
         account_data: dict, 
@@ -40,6 +50,16 @@ class AccountRepository(BaseRepository[Account]):
         
         return account, contact
 
+    async def bulk_create_with_contacts(
+        self, 
+        account_records: List[dict], 
+        contact_records: List[dict]
+    ) -> None:
+        """Insert accounts and then their contacts, one executemany statement each."""
+        await self.bulk_insert(account_records)
+        if contact_records:
+            await self.session.execute(insert(Contact), contact_records)
+
     async def exists_by_client_id(self, client_id: str) -> bool:
         """Check if account exists by client_id."""
         result = await self.session.execute(
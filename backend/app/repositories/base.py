@@ -1,5 +1,6 @@
 from typing import Generic, TypeVar, Optional, List, Any
 from sqlmodel import SQLModel, select
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 ModelType = TypeVar("ModelType", bound=SQLModel)
@@ -11,6 +12,7 @@ class BaseRepository(Generic[ModelType]):
     def __init__(self, model: type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
+        self._fields = frozenset(model.model_fields)
     
     async def get_by_id(self, id: str) -> Optional[ModelType]:
         """Get a record by its ID."""
@@ -30,10 +32,22 @@ class BaseRepository(Generic[ModelType]):
         await self.session.refresh(db_obj)
         return db_obj
     
+    async def bulk_insert(self, records: List[dict]) -> int:
+        """
+        Insert many records with a single executemany INSERT.
+        
+        Records must share the same keys and already carry their primary keys.
+        The ORM is bypassed and nothing is committed. Returns the number of rows.
+        """
+        if not records:
+            return 0
+        await self.session.execute(insert(self.model), records)
+        return len(records)
+    
     async def update(self, db_obj: ModelType, obj_in: dict) -> ModelType:
         """Update an existing record."""
         for field, value in obj_in.items():
-            if hasattr(db_obj, field):
+            if field in self._fields:
                 setattr(db_obj, field, value)
         
         self.session.add(db_obj)
@@ -1,5 +1,7 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from sqlmodel import select, func
+from sqlalchemy import delete, insert, literal, or_, true, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -18,6 +20,8 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
         result = await self.session.execute(
             select(EmailTemplate)
             .where(EmailTemplate.identifier == identifier, EmailTemplate.is_active == True)
+            .order_by(EmailTemplate.version.desc())
+            .limit(1)
         )
         return result.scalars().first()
 
@@ -29,81 +33,180 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
         )
         return result.scalars().first()
 
-    async def get_versions_by_identifier(self, identifier: str) -> List[EmailTemplate]:
-        """Get all versions of a template by identifier, ordered by version desc."""
+    async def get_version_rows_by_identifier(self, identifier: str) -> List[Row]:
+        """
+        Get version metadata of a template, ordered by version desc.
+        
+        Selects plain columns (no data blob) so rows aren't hydrated into
+        tracked EmailTemplate entities; fields are readable as attributes.
+        """
         result = await self.session.execute(
-            select(EmailTemplate)
+            select(
+                EmailTemplate.id,
+                EmailTemplate.version,
+                EmailTemplate.is_active,
+                EmailTemplate.created_at,
+                EmailTemplate.updated_at
+            )
             .where(EmailTemplate.identifier == identifier)
             .order_by(EmailTemplate.version.desc())
         )
-        return result.scalars().all()
+        return result.all()
 
-    async def get_all_latest_versions(self) -> List[EmailTemplate]:
-        """Get the latest active version for each template identifier."""
+    async def get_latest_versions_paginated(
+        self, 
+        skip: int = 0, 
+        limit: int = 100
+    ) -> Tuple[List[EmailTemplate], int]:
+        """Get a page of active template versions, ordered by identifier, and the total count."""
+        # COUNT(*) OVER () returns the total alongside the page in one query
         result = await self.session.execute(
-            select(EmailTemplate)
+            select(EmailTemplate, func.count().over().label("total"))
             .where(EmailTemplate.is_active == True)
             .order_by(EmailTemplate.identifier)
+            .offset(skip)
+            .limit(limit)
         )
-        return result.scalars().all()
-
-    async def get_next_version_number(self, identifier: str) -> int:
-        """Get the next version number for a template identifier."""
-        result = await self.session.execute(
-            select(func.max(EmailTemplate.version))
-            .where(EmailTemplate.identifier == identifier)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        # A page past the end has no rows to carry the total
+        if skip == 0:
+            return [], 0
+        total = await self.session.scalar(
+            select(func.count()).select_from(EmailTemplate).where(EmailTemplate.is_active == True)
         )
-        max_version = result.scalar()
-        return (max_version or 0) + 1
+        return [], total or 0
 
-    async def create_new_version(self, identifier: str, data: Dict[str, Any]) -> EmailTemplate:
-        """Create a new version of an email template and deactivate previous versions."""
-        # Deactivate all previous versions of this template
-        from sqlalchemy import update
-        await self.session.execute(
-            update(EmailTemplate)
-            .where(EmailTemplate.identifier == identifier)
-            .values(is_active=False)
-        )
-        
-        # Get next version number
-        next_version = await self.get_next_version_number(identifier)
-        
-        # Create new active version
-        template_data = {
-            "identifier": identifier,
-            "version": next_version,
-            "data": data,
-            "is_active": True
-        }
+    async def get_latest_summaries(
+        self, 
+        identifier_prefix: Optional[str] = None
+    ) -> List[Tuple[str, Dict[str, Any], Optional[str]]]:
+        """
+        Get (identifier, data, summary_json) of the active version of each template.
         
-        new_template = EmailTemplate(**template_data)
-        self.session.add(new_template)
-        await self.session.flush()  # Flush to get the ID
+        Rows are ordered by identifier; summary_json is the payload stored when
+        the version was written and may be None for rows that predate it.
         
-        return new_template
+        Args:
+            identifier_prefix: Only include identifiers starting with this literal prefix
+        """
+        query = (
+            select(EmailTemplate.identifier, EmailTemplate.data, EmailTemplate.summary_json)
+            .where(EmailTemplate.is_active == True)
+            .order_by(EmailTemplate.identifier)
+        )
+        if identifier_prefix:
+            # autoescape keeps '_' and '%' in the prefix from acting as LIKE wildcards
+            query = query.where(EmailTemplate.identifier.startswith(identifier_prefix, autoescape=True))
+        result = await self.session.execute(query)
+        return result.all()
 
-    async def activate_version(self, identifier: str, version: int) -> Optional[EmailTemplate]:
-        """Activate a specific version of a template and deactivate others."""
-        # Check if the version exists
-        target_template = await self.get_by_identifier_and_version(identifier, version)
-        if not target_template:
-            return None
+    async def upsert_new_version(
+        self, 
+        identifier: str, 
+        data: Dict[str, Any],
+        summary_json: Optional[str] = None
+    ) -> EmailTemplate:
+        """
+        Insert the next active version of a template in a single statement.
         
-        # Deactivate all versions of this template
-        from sqlalchemy import update
-        await self.session.execute(
+        A data-modifying CTE deactivates the current versions while the
+        INSERT ... SELECT numbers the new row from COALESCE(MAX(version), 0) + 1,
+        so first versions and new versions of existing templates take the
+        same path without probing for the latest version first.
+        
+        Args:
+            identifier: Template identifier
+            data: Template JSON data (subject and body)
+            summary_json: Pre-serialized summary payload for the new version
+            
+        Returns:
+            EmailTemplate: The newly inserted active version
+        """
+        # Client-side defaults (id, timestamps) come from the model as usual
+        defaults = EmailTemplate(identifier=identifier, version=1, data=data)
+        table = EmailTemplate.__table__
+        deactivated = (
             update(EmailTemplate)
-            .where(EmailTemplate.identifier == identifier)
+            .where(EmailTemplate.identifier == identifier, EmailTemplate.is_active == True)
             .values(is_active=False)
+            .returning(EmailTemplate.id)
+            .cte("deactivated")
+        )
+        next_version = select(
+            literal(defaults.id),
+            literal(identifier),
+            func.coalesce(func.max(EmailTemplate.version), 0) + 1,
+            literal(data, table.c.data.type),
+            true(),
+            literal(defaults.created_at),
+            literal(defaults.updated_at),
+            literal(summary_json, table.c.summary_json.type)
+        ).where(EmailTemplate.identifier == identifier)
+        stmt = (
+            insert(EmailTemplate)
+            .from_select(
+                [
+                    "id", "identifier", "version", "data", "is_active",
+                    "created_at", "updated_at", "summary_json"
+                ],
+                next_version
+            )
+            .add_cte(deactivated)
+            .returning(*table.c)
+        )
+        result = await self.session.execute(
+            select(EmailTemplate).from_statement(stmt)
         )
+        return result.scalars().one()
+
+    async def activate_version(
+        self, 
+        identifier: str, 
+        version: int
+    ) -> Tuple[Optional[EmailTemplate], Optional[int]]:
+        """
+        Activate a specific version of a template and deactivate others in one statement.
         
-        # Activate the target version
-        target_template.is_active = True
-        self.session.add(target_template)
-        await self.session.flush()
+        Every part of the UPDATE sees the pre-update snapshot, so the RETURNING
+        subquery reports the previously active version and the EXISTS guard
+        leaves the template untouched when the target version doesn't exist.
         
-        return target_template
+        Returns:
+            Tuple of the activated template (None if the version doesn't exist)
+            and the previously active version number
+        """
+        previous_version = (
+            select(EmailTemplate.version)
+            .where(EmailTemplate.identifier == identifier, EmailTemplate.is_active == True)
+            .limit(1)
+            .scalar_subquery()
+        )
+        target_exists = (
+            select(EmailTemplate.id)
+            .where(EmailTemplate.identifier == identifier, EmailTemplate.version == version)
+            .exists()
+        )
+        result = await self.session.execute(
+            update(EmailTemplate)
+            .where(
+                EmailTemplate.identifier == identifier,
+                or_(EmailTemplate.is_active == True, EmailTemplate.version == version),
+                target_exists
+            )
+            .values(is_active=EmailTemplate.version == version)
+            .returning(EmailTemplate, previous_version.label("previous_version"))
+            .execution_options(synchronize_session="fetch")
+        )
+        
+        activated_template = None
+        previous = None
+        for template, previous in result.all():
+            if template.version == version:
+                activated_template = template
+        return activated_template, previous
 
     async def get_all_identifiers(self) -> List[str]:
         """Get all unique template identifiers."""
@@ -114,20 +217,14 @@ class EmailTemplateRepository(BaseRepository[EmailTemplate]):
         )
         return result.scalars().all()
 
-    async def delete_template_by_identifier(self, identifier: str) -> bool:
-        """Delete all versions of a template by identifier."""
-        # Get all versions of the template
-        templates = await self.get_versions_by_identifier(identifier)
-        
-        if not templates:
-            return False
-        
-        # Delete all versions
-        for template in templates:
-            await self.session.delete(template)
-        
-        await self.session.flush()
-        return True
+    async def delete_template_by_identifier(self, identifier: str) -> int:
+        """Delete all versions of a template by identifier and return how many were deleted."""
+        result = await self.session.execute(
+            delete(EmailTemplate)
+            .where(EmailTemplate.identifier == identifier)
+            .returning(EmailTemplate.id)
+        )
+        return len(result.all())
 
     async def template_exists(self, identifier: str) -> bool:
         """Check if a template with the given identifier exists."""
@@ -1,5 +1,6 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Set
 from sqlmodel import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.invoice import Invoice
@@ -40,6 +41,15 @@ class InvoiceRepository(BaseRepository[Invoice]):
         )
         return result.scalars().all()
 
+    async def get_by_invoice_numbers(self, invoice_numbers: Set[str]) -> Dict[str, Invoice]:
+        """Get invoices for many invoice numbers in one query, keyed by invoice_number."""
+        if not invoice_numbers:
+            return {}
+        result = await self.session.execute(
+            select(Invoice).where(Invoice.invoice_number.in_(invoice_numbers))
+        )
+        return {invoice.invoice_number: invoice for invoice in result.scalars().all()}
+
     async def create_invoice(self, invoice_data: dict) -> Invoice:
         """Create a new invoice."""
         invoice = Invoice(**invoice_data)
@@ -47,10 +57,38 @@ class InvoiceRepository(BaseRepository[Invoice]):
         await self.session.flush()  # Flush but don't commit - let service handle transaction
         return invoice
 
+    async def bulk_upsert(self, records: List[dict]) -> int:
+        """
+        Insert new invoices and update changed amounts in one statement.
+        
+        Uses INSERT ... ON CONFLICT (invoice_number) DO UPDATE. Conflicting rows
+        are only rewritten when an amount actually differs. If an invoice number
+        appears more than once, the last record wins, because Postgres rejects a
+        statement that touches the same row twice. Returns the number of records
+        sent.
+        """
+        if not records:
+            return 0
+        records = list({record["invoice_number"]: record for record in records}.values())
+        stmt = pg_insert(Invoice).values(records)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Invoice.invoice_number],
+            set_={
+                "invoice_amount": stmt.excluded.invoice_amount,
+                "total_outstanding": stmt.excluded.total_outstanding
+            },
+            where=(
+                Invoice.invoice_amount.is_distinct_from(stmt.excluded.invoice_amount)
+                | Invoice.total_outstanding.is_distinct_from(stmt.excluded.total_outstanding)
+            )
+        )
+        await self.session.execute(stmt)
+        return len(records)
+
     async def update_invoice(self, invoice: Invoice, invoice_data: dict) -> Invoice:
         """Update an existing invoice."""
         for field, value in invoice_data.items():
-            if hasattr(invoice, field):
+            if field in self._fields:
                 setattr(invoice, field, value)
         
         self.session.add(invoice)
@@ -1,12 +1,29 @@
-from typing import Optional, List
+import uuid
+from typing import Optional, List, Dict, Set
+from decimal import Decimal
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
-from datetime import date
+from datetime import date, datetime
 
 from app.models.invoice_aging_snapshot import InvoiceAgingSnapshot
 from app.repositories.base import BaseRepository
 
 
+# Column order used when streaming snapshot rows through COPY
+COPY_COLUMNS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "invoice_id",
+    "snapshot_date",
+    "days_0_30",
+    "days_31_60",
+    "days_61_90",
+    "days_91_120",
+    "days_over_120",
+)
+
+
 class InvoiceAgingSnapshotRepository(BaseRepository[InvoiceAgingSnapshot]):
     """Repository for InvoiceAgingSnapshot operations."""
 
@@ -41,6 +58,44 @@ class InvoiceAgingSnapshotRepository(BaseRepository[InvoiceAgingSnapshot]):
         await self.session.flush()  # Flush but don't commit - let service handle transaction
         return snapshot
 
+    async def bulk_copy(self, records: List[dict]) -> int:
+        """
+        Bulk insert aging snapshots using PostgreSQL COPY.
+        
+        Rows are written through the session's asyncpg connection, so they are
+        part of the current transaction but bypass the ORM (no identity map,
+        no per-row INSERT). Returns the number of rows copied.
+        """
+        if not records:
+            return 0
+        
+        now = datetime.utcnow()
+        zero = Decimal('0')
+        rows = [
+            (
+                record.get("id") or str(uuid.uuid4()),
+                now,
+                now,
+                record["invoice_id"],
+                record["snapshot_date"],
+                record.get("days_0_30", zero),
+                record.get("days_31_60", zero),
+                record.get("days_61_90", zero),
+                record.get("days_91_120", zero),
+                record.get("days_over_120", zero),
+            )
+            for record in records
+        ]
+        
+        conn = await self.session.connection()
+        raw_connection = await conn.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            InvoiceAgingSnapshot.__tablename__,
+            records=rows,
+            columns=COPY_COLUMNS
+        )
+        return len(rows)
+
     async def get_latest_snapshot_by_invoice(self, invoice_id: str) -> Optional[InvoiceAgingSnapshot]:
         """Get the most recent aging snapshot for an invoice."""
         result = await self.session.execute(
@@ -51,6 +106,22 @@ class InvoiceAgingSnapshotRepository(BaseRepository[InvoiceAgingSnapshot]):
         )
         return result.scalars().first()
 
+    async def get_latest_snapshots_by_invoice_ids(
+        self, 
+        invoice_ids: Set[str]
+    ) -> Dict[str, InvoiceAgingSnapshot]:
+        """Get the most recent aging snapshot for many invoices, keyed by invoice_id."""
+        if not invoice_ids:
+            return {}
+        # DISTINCT ON keeps the first row per invoice, i.e. the latest snapshot
+        result = await self.session.execute(
+            select(InvoiceAgingSnapshot)
+            .where(InvoiceAgingSnapshot.invoice_id.in_(invoice_ids))
+            .distinct(InvoiceAgingSnapshot.invoice_id)
+            .order_by(InvoiceAgingSnapshot.invoice_id, InvoiceAgingSnapshot.snapshot_date.desc())
+        )
+        return {snapshot.invoice_id: snapshot for snapshot in result.scalars().all()}
+
     async def exists_for_invoice_and_date(
         self, 
         invoice_id: str, 
@@ -0,0 +1,20 @@
+from decimal import Decimal
+from typing import Any
+
+
+def orjson_default(obj: Any) -> Any:
+    """
+    Fallback encoder for orjson.dumps.
+    
+    orjson handles datetime, date and UUID natively; Decimal amounts are
+    emitted as strings so no precision is lost, matching the API responses.
+    
+    Args:
+        obj: Object orjson could not serialize
+        
+    Returns:
+        JSON-serializable representation of the object
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
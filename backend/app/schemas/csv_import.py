@@ -1,22 +1,30 @@
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
-from pydantic import BaseModel, EmailStr, Field, validator
+from typing import Annotated, List, Optional, Set
+from pydantic import BaseModel, Field, StringConstraints, model_validator, validator
 from sqlmodel import SQLModel
 
+from app.utils import EMAIL_RE
+
+# Stripped, non-empty string checked inside pydantic-core rather than a Python validator
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+# Allowed rounding difference between the aging buckets and total outstanding
+AGING_TOTAL_TOLERANCE = Decimal('0.01')
+
 
 class CSVRowSchema(BaseModel):
     """Schema for validating individual CSV rows from CSV1.csv format."""
     
     # Account fields (from CSV1)
-    client_id: str = Field(..., description="Unique client identifier")
-    account_name: str = Field(..., description="Account name")
+    client_id: NonEmptyStr = Field(..., description="Unique client identifier")
+    account_name: NonEmptyStr = Field(..., description="Account name")
     
     # Contact fields (from CSV1 - email only, others computed)
-    email: Optional[EmailStr] = Field(None, description="Contact email address")
+    email: Optional[str] = Field(None, description="Contact email address")
     
     # Invoice fields (from CSV1)
-    invoice_number: str = Field(..., description="Unique invoice number")
+    invoice_number: NonEmptyStr = Field(..., description="Unique invoice number")
     invoice_date: date = Field(..., description="Invoice date")
     invoice_amount: Decimal = Field(..., ge=0, description="Original invoice amount")
     total_outstanding: Decimal = Field(..., ge=0, description="Current outstanding amount")
@@ -35,45 +43,30 @@ class CSVRowSchema(BaseModel):
     is_billing_contact: bool = Field(default=True, description="Whether this is a billing contact (computed)")
     snapshot_date: Optional[date] = Field(None, description="Aging snapshot date (computed)")
     
-    @validator('client_id', 'account_name', 'invoice_number')
-    def validate_non_empty_strings(cls, v):
-        """Ensure string fields are not empty."""
-        if not v or not v.strip():
-            raise ValueError('Field cannot be empty')
-        return v.strip()
-    
-    @validator('total_outstanding')
-    def validate_outstanding_amount(cls, v, values):
-        """Ensure outstanding amount doesn't exceed invoice amount."""
-        if 'invoice_amount' in values and v > values['invoice_amount']:
-            raise ValueError('Outstanding amount cannot exceed invoice amount')
-        return v
-    
-    @validator('days_0_30', 'days_31_60', 'days_61_90', 'days_91_120', 'days_over_120')
-    def validate_aging_amounts(cls, v):
-        """Ensure aging amounts are valid decimals."""
-        if v < 0:
-            raise ValueError('Aging amounts cannot be negative')
-        return v
-    
-    @validator('days_0_30', 'days_31_60', 'days_61_90', 'days_91_120', 'days_over_120', always=True)
-    def validate_aging_totals(cls, v, values):
-        """Ensure aging bucket totals approximately match total outstanding."""
-        if all(field in values for field in ['days_0_30', 'days_31_60', 'days_61_90', 'days_91_120', 'days_over_120', 'total_outstanding']):
-            total_aging = (values['days_0_30'] + values['days_31_60'] + 
-                          values['days_61_90'] + values['days_91_120'] + values['days_over_120'])
-            outstanding = values['total_outstanding']
-            
-            # Allow small rounding differences
-            if abs(total_aging - outstanding) > Decimal('0.01'):
-                raise ValueError(f'Aging buckets total ({total_aging}) does not match total outstanding ({outstanding})')
+    @validator('email', pre=True)
+    def validate_email(cls, v):
+        """Normalize blank emails to None and reject obviously malformed addresses."""
+        if not isinstance(v, str):
+            return v
+        v = v.strip()
+        if not v:
+            return None
+        if not EMAIL_RE.fullmatch(v):
+            raise ValueError('Invalid email address')
         return v
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            date: lambda v: v.isoformat()
-        }
+    @model_validator(mode='after')
+    def validate_amounts(self):
+        """Ensure outstanding fits the invoice amount and matches the aging buckets."""
+        outstanding = self.total_outstanding
+        if outstanding > self.invoice_amount:
+            raise ValueError('Outstanding amount cannot exceed invoice amount')
+        
+        total_aging = (self.days_0_30 + self.days_31_60 + self.days_61_90 +
+                       self.days_91_120 + self.days_over_120)
+        if abs(total_aging - outstanding) > AGING_TOTAL_TOLERANCE:
+            raise ValueError(f'Aging buckets total ({total_aging}) does not match total outstanding ({outstanding})')
+        return self
 
 
 class AgingSnapshotSummary(BaseModel):
@@ -89,10 +82,16 @@ class AgingSnapshotSummary(BaseModel):
     days_over_120: Decimal = Field(..., ge=0, description="Amount outstanding over 120 days")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v),
-            date: lambda v: v.isoformat()
-        }
+        frozen = True
+
+
+class CreatedAgingSnapshot(AgingSnapshotSummary):
+    """Aging snapshot created during an import, with the keys needed to group it by account."""
+    
+    account_id: str = Field(..., description="Account the invoice belongs to")
+    account_name: str = Field(..., description="Account name")
+    invoice_id: str = Field(..., description="Invoice the snapshot was created for")
+    total_outstanding: Decimal = Field(..., ge=0, description="Invoice total outstanding")
 
 
 class ContactReadyClient(BaseModel):
@@ -106,9 +105,7 @@ class ContactReadyClient(BaseModel):
     dnc_status: bool = Field(..., description="Do not contact status based on email and aging bucket distribution")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+        frozen = True
 
 
 class ImportErrorSchema(BaseModel):
@@ -136,13 +133,16 @@ class ImportResultSchema(BaseModel):
     errors: List[ImportErrorSchema] = Field(default=[], description="List of errors encountered")
     processing_time_seconds: float = Field(..., description="Time taken to process import")
     
-    @validator('successful_rows', 'failed_rows')
-    def validate_row_counts(cls, v, values):
+    @model_validator(mode='after')
+    def validate_row_counts(self):
         """Ensure row counts are consistent."""
-        if 'total_rows' in values:
-            if v < 0 or v > values['total_rows']:
-                raise ValueError('Row count cannot be negative or exceed total rows')
-        return v
+        successful_rows = self.successful_rows
+        failed_rows = self.failed_rows
+        # Non-negative counts whose sum fits also fit individually
+        if (successful_rows < 0 or failed_rows < 0 or
+                successful_rows + failed_rows > self.total_rows):
+            raise ValueError('Row count cannot be negative or exceed total rows')
+        return self
 
 
 class ImportStatsSchema(BaseModel):
@@ -155,7 +155,7 @@ class ImportStatsSchema(BaseModel):
     invoices_created: int = Field(default=0, description="New invoices created")
     invoices_updated: int = Field(default=0, description="Existing invoices updated")
     aging_snapshots_created: int = Field(default=0, description="Aging snapshots created")
-    duplicate_invoice_numbers: List[str] = Field(default=[], description="Duplicate invoice numbers encountered")
-    created_aging_snapshots: List[dict] = Field(default=[], description="Details of aging snapshots created during import")
+    duplicate_invoice_numbers: Set[str] = Field(default_factory=set, description="Duplicate invoice numbers encountered")
+    created_aging_snapshots: List[CreatedAgingSnapshot] = Field(default=[], description="Details of aging snapshots created during import")
     validation_errors: int = Field(default=0, description="Number of validation errors")
     database_errors: int = Field(default=0, description="Number of database errors")
\ No newline at end of file
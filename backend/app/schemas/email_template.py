@@ -1,7 +1,12 @@
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field, validator
 
+# Template identifiers: uppercase letters, numbers and underscores, not starting with a digit
+_IDENTIFIER_RE = re.compile(r'[A-Z_][A-Z0-9_]*')
+
 
 class EmailTemplateData(BaseModel):
     """Schema for validating JSONB email template data."""
@@ -22,6 +27,31 @@ class EmailTemplateData(BaseModel):
         if not v.strip():
             raise ValueError('Body cannot be empty')
         return v.strip()
+    
+    class Config:
+        frozen = True
+
+
+@lru_cache(maxsize=1024)
+def _parse_template_data(subject: Any, body: Any) -> EmailTemplateData:
+    """Validate template content once per distinct subject/body pair."""
+    return EmailTemplateData(subject=subject, body=body)
+
+
+def parse_template_data(data: Dict[str, Any]) -> EmailTemplateData:
+    """
+    Parse the JSONB data of a stored template into EmailTemplateData.
+    
+    Stored template content never changes in place (updates create a new
+    version), so results are memoized on the subject and body themselves.
+    
+    Args:
+        data: Raw template data from the email_templates.data column
+        
+    Returns:
+        EmailTemplateData: Validated template data
+    """
+    return _parse_template_data(data.get('subject'), data.get('body'))
 
 
 class EmailTemplateCreate(BaseModel):
@@ -31,17 +61,21 @@ class EmailTemplateCreate(BaseModel):
         ..., 
         min_length=1, 
         max_length=100, 
-        pattern=r'^[A-Z_][A-Z0-9_]*$',
         description="Template identifier (uppercase letters, numbers, underscores only)"
     )
     data: EmailTemplateData = Field(..., description="Template data containing subject and body")
     
-    @validator('identifier')
+    @validator('identifier', pre=True)
     def validate_identifier(cls, v):
-        """Ensure identifier follows naming conventions."""
-        if not v.strip():
+        """Normalize identifier to uppercase and ensure it follows naming conventions."""
+        if not isinstance(v, str):
+            return v
+        v = v.strip().upper()
+        if not v:
             raise ValueError('Identifier cannot be empty')
-        return v.strip().upper()
+        if not _IDENTIFIER_RE.fullmatch(v):
+            raise ValueError('Identifier must start with a letter or underscore and contain only letters, numbers and underscores')
+        return v
 
 
 class EmailTemplateUpdate(BaseModel):
@@ -63,6 +97,28 @@ class EmailTemplateResponse(BaseModel):
     
     class Config:
         from_attributes = True
+        frozen = True
+    
+    @classmethod
+    def from_template(cls, template: Any) -> "EmailTemplateResponse":
+        """
+        Build a response from an EmailTemplate row using the cached data parser.
+        
+        Args:
+            template: EmailTemplate database row
+            
+        Returns:
+            EmailTemplateResponse: Response for the template version
+        """
+        return cls.model_construct(
+            id=template.id,
+            identifier=template.identifier,
+            version=template.version,
+            data=parse_template_data(template.data),
+            is_active=template.is_active,
+            created_at=template.created_at,
+            updated_at=template.updated_at
+        )
 
 
 class EmailTemplateVersionResponse(BaseModel):
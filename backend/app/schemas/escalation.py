@@ -1,10 +1,28 @@
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Annotated, List, Literal, Optional, Dict, Any, Tuple, Union
 from pydantic import BaseModel, Field, EmailStr, validator
 from decimal import Decimal
 
 from app.schemas.csv_import import ContactReadyClient, AgingSnapshotSummary
 
+# Fixed value sets; validated as literals and shared as constant strings
+AgingBucket = Literal["0-30", "31-60", "61-90", "91-120", "120+"]
+EscalationTemplateIdentifier = Literal["ESCALATION_LEVEL_1", "ESCALATION_LEVEL_2", "ESCALATION_LEVEL_3"]
+
+
+class TrustedModel(BaseModel):
+    """Base for schemas the escalation service builds from already-validated data."""
+    
+    @classmethod
+    def from_trusted(cls, **data: Any):
+        """
+        Build an instance without running field validation.
+        
+        Only use for data produced server-side from validated inputs;
+        request payloads must go through normal construction.
+        """
+        return cls.model_construct(**data)
+
 
 class EscalationDegreeInfo(BaseModel):
     """Information about escalation degree calculation."""
@@ -15,7 +33,7 @@ class EscalationDegreeInfo(BaseModel):
     total_amount: Decimal = Field(..., ge=0, description="Total amount for qualifying invoices")
 
 
-class InvoiceDetail(BaseModel):
+class InvoiceDetail(TrustedModel):
     """Details about an individual invoice for email statistics."""
     
     invoice_id: str = Field(..., description="Invoice ID")
@@ -23,15 +41,13 @@ class InvoiceDetail(BaseModel):
     invoice_amount: Decimal = Field(..., description="Original invoice amount")
     total_outstanding: Decimal = Field(..., description="Current outstanding amount")
     days_overdue: int = Field(..., description="Number of days overdue")
-    aging_bucket: str = Field(..., description="Aging bucket (31-60, 61-90, 91-120, 120+)")
+    aging_bucket: AgingBucket = Field(..., description="Aging bucket (0-30, 31-60, 61-90, 91-120, 120+)")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+        frozen = True
 
 
-class AgingSummary(BaseModel):
+class AgingSummary(TrustedModel):
     """Summary of aging buckets across all invoices."""
     
     days_0_30: Decimal = Field(default=Decimal('0'), description="Amount in 0-30 days")
@@ -42,29 +58,21 @@ class AgingSummary(BaseModel):
     total: Decimal = Field(default=Decimal('0'), description="Total outstanding amount")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+        frozen = True
 
 
-class EmailSendingDetail(BaseModel):
-    """Detailed information about a sent escalation email."""
+class EmailSendingDetailBase(TrustedModel):
+    """Detailed information about an escalation email send attempt."""
     
     # Account information
     account_id: str = Field(..., description="Account ID")
     account_name: str = Field(..., description="Account name")
     email_address: str = Field(..., description="Email address")
-    
-    # Email sending details
-    email_sent: bool = Field(..., description="Whether email was sent successfully")
-    email_sent_at: Optional[datetime] = Field(None, description="When email was sent")
-    email_message_id: Optional[str] = Field(None, description="SMTP message ID")
     email_subject: str = Field(..., description="Email subject")
-    email_send_error: Optional[str] = Field(None, description="Error message if sending failed")
     
     # Escalation details
     escalation_degree: int = Field(..., ge=1, le=3, description="Escalation degree (1-3)")
-    template_used: str = Field(..., description="Email template identifier")
+    template_used: EscalationTemplateIdentifier = Field(..., description="Email template identifier")
     
     # Invoice summary
     invoice_count: int = Field(..., description="Number of overdue invoices")
@@ -78,9 +86,29 @@ class EmailSendingDetail(BaseModel):
     aging_summary: AgingSummary = Field(..., description="Summary of aging buckets")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+        frozen = True
+
+
+class EmailSendingDetailSent(EmailSendingDetailBase):
+    """Sending detail for an email that was delivered to the SMTP server."""
+    
+    email_sent: Literal[True] = Field(default=True, description="Whether email was sent successfully")
+    email_sent_at: datetime = Field(..., description="When email was sent")
+    email_message_id: Optional[str] = Field(None, description="SMTP message ID")
+
+
+class EmailSendingDetailFailed(EmailSendingDetailBase):
+    """Sending detail for an email that could not be sent."""
+    
+    email_sent: Literal[False] = Field(default=False, description="Whether email was sent successfully")
+    email_send_error: str = Field(..., description="Error message if sending failed")
+
+
+# Discriminated on email_sent so validation picks the matching model directly
+EmailSendingDetail = Annotated[
+    Union[EmailSendingDetailSent, EmailSendingDetailFailed],
+    Field(discriminator='email_sent')
+]
 
 
 class EscalationRequest(BaseModel):
@@ -88,6 +116,7 @@ class EscalationRequest(BaseModel):
     
     contact_ready_clients: List[ContactReadyClient] = Field(
         ..., 
+        min_length=1,
         description="List of contact ready clients with aging snapshots"
     )
     preview_only: bool = Field(
@@ -109,15 +138,15 @@ class EscalationRequest(BaseModel):
         description="Whether to retry failed email sends"
     )
     
-    @validator('contact_ready_clients')
+    @validator('contact_ready_clients', pre=True)
     def validate_clients(cls, v):
-        """Ensure at least one client is provided."""
+        """Reject an empty client list before any client is validated."""
         if not v:
             raise ValueError('At least one contact ready client must be provided')
         return v
 
 
-class EscalationResult(BaseModel):
+class EscalationResultBase(TrustedModel):
     """Result of AI-generated escalation email."""
     
     account: str = Field(..., description="Account name")
@@ -125,24 +154,38 @@ class EscalationResult(BaseModel):
     email_subject: str = Field(..., description="Email subject line")
     email_body: str = Field(..., description="Personalized HTML email content")
     escalation_degree: int = Field(..., ge=1, le=3, description="Calculated escalation degree")
-    template_used: str = Field(..., description="Email template identifier used")
+    template_used: EscalationTemplateIdentifier = Field(..., description="Email template identifier used")
     invoice_count: int = Field(..., ge=1, description="Number of overdue invoices")
     total_outstanding: Decimal = Field(..., ge=0, description="Total outstanding amount")
     
-    # Email sending tracking
-    email_sent: bool = Field(default=False, description="Whether email was sent successfully")
-    email_sent_at: Optional[datetime] = Field(None, description="When email was sent")
-    email_message_id: Optional[str] = Field(None, description="SMTP message ID")
-    email_send_error: Optional[str] = Field(None, description="Error message if sending failed")
-    
     # Detailed invoice data
     invoice_details: List[InvoiceDetail] = Field(default=[], description="List of invoice details")
     aging_summary: Optional[AgingSummary] = Field(None, description="Summary of aging buckets")
     
     class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
+        frozen = True
+
+
+class EscalationResultPending(EscalationResultBase):
+    """Escalation email that has not been sent (preview, not yet sent, or failed)."""
+    
+    email_sent: Literal[False] = Field(default=False, description="Whether email was sent successfully")
+    email_send_error: Optional[str] = Field(None, description="Error message if sending failed")
+
+
+class EscalationResultSent(EscalationResultBase):
+    """Escalation email that was sent successfully."""
+    
+    email_sent: Literal[True] = Field(default=True, description="Whether email was sent successfully")
+    email_sent_at: datetime = Field(..., description="When email was sent")
+    email_message_id: Optional[str] = Field(None, description="SMTP message ID")
+
+
+# Discriminated on email_sent so validation picks the matching model directly
+EscalationResult = Annotated[
+    Union[EscalationResultPending, EscalationResultSent],
+    Field(discriminator='email_sent')
+]
 
 
 class EmailSendingSummary(BaseModel):
@@ -174,17 +217,148 @@ class EscalationBatchResponse(BaseModel):
     email_sending_details: List[EmailSendingDetail] = Field(default=[], description="Detailed statistics for each sent email")
 
 
+class EscalationBatchResponseSoA(BaseModel):
+    """
+    Columnar (structure-of-arrays) form of EscalationBatchResponse.
+    
+    Each per-result field becomes a parallel list indexed by result position.
+    Invoice details are flattened CSR-style: the invoices for result i are
+    invoice_details_flat[invoice_offsets[i]:invoice_offsets[i + 1]].
+    """
+    
+    success: bool = Field(..., description="Whether the batch processing was successful")
+    processed_count: int = Field(..., description="Number of accounts processed")
+    emails_generated: int = Field(..., description="Number of emails generated")
+    skipped_count: int = Field(..., description="Number of accounts skipped")
+    skipped_reasons: Dict[str, int] = Field(..., description="Reasons for skipping accounts with counts")
+    processing_time_seconds: float = Field(..., description="Time taken to process the batch")
+    errors: List[str] = Field(default=[], description="Any errors encountered during processing")
+    email_sending_summary: Optional[EmailSendingSummary] = Field(None, description="Summary of email sending operations")
+    email_sending_details: List[EmailSendingDetail] = Field(default=[], description="Detailed statistics for each sent email")
+    
+    # Escalation results, one entry per result
+    accounts: List[str] = Field(default=[], description="Account names")
+    email_addresses: List[str] = Field(default=[], description="Contact email addresses")
+    email_subjects: List[str] = Field(default=[], description="Email subject lines")
+    email_bodies: List[str] = Field(default=[], description="Personalized HTML email content")
+    escalation_degrees: List[int] = Field(default=[], description="Calculated escalation degrees")
+    templates_used: List[str] = Field(default=[], description="Email template identifiers used")
+    invoice_counts: List[int] = Field(default=[], description="Number of overdue invoices")
+    total_outstandings: List[Decimal] = Field(default=[], description="Total outstanding amounts")
+    emails_sent: List[bool] = Field(default=[], description="Whether each email was sent successfully")
+    emails_sent_at: List[Optional[datetime]] = Field(default=[], description="When each email was sent")
+    email_message_ids: List[Optional[str]] = Field(default=[], description="SMTP message IDs")
+    email_send_errors: List[Optional[str]] = Field(default=[], description="Error messages if sending failed")
+    aging_summaries: List[Optional[AgingSummary]] = Field(default=[], description="Summary of aging buckets")
+    invoice_details_flat: List[InvoiceDetail] = Field(default=[], description="Invoice details of all results, concatenated")
+    invoice_offsets: List[int] = Field(default=[0], description="Start offset of each result's invoices, plus the end offset")
+    
+    @classmethod
+    def from_aos(cls, response: EscalationBatchResponse) -> "EscalationBatchResponseSoA":
+        """
+        Convert a batch response into its columnar form.
+        
+        Args:
+            response: Batch response with a list of escalation results
+            
+        Returns:
+            EscalationBatchResponseSoA: Same data laid out as parallel lists
+        """
+        results = response.escalation_results
+        invoice_details_flat: List[InvoiceDetail] = []
+        invoice_offsets = [0]
+        for result in results:
+            invoice_details_flat.extend(result.invoice_details)
+            invoice_offsets.append(len(invoice_details_flat))
+        
+        return cls.model_construct(
+            success=response.success,
+            processed_count=response.processed_count,
+            emails_generated=response.emails_generated,
+            skipped_count=response.skipped_count,
+            skipped_reasons=response.skipped_reasons,
+            processing_time_seconds=response.processing_time_seconds,
+            errors=response.errors,
+            email_sending_summary=response.email_sending_summary,
+            email_sending_details=response.email_sending_details,
+            accounts=[r.account for r in results],
+            email_addresses=[r.email_address for r in results],
+            email_subjects=[r.email_subject for r in results],
+            email_bodies=[r.email_body for r in results],
+            escalation_degrees=[r.escalation_degree for r in results],
+            templates_used=[r.template_used for r in results],
+            invoice_counts=[r.invoice_count for r in results],
+            total_outstandings=[r.total_outstanding for r in results],
+            emails_sent=[r.email_sent for r in results],
+            emails_sent_at=[getattr(r, 'email_sent_at', None) for r in results],
+            email_message_ids=[getattr(r, 'email_message_id', None) for r in results],
+            email_send_errors=[getattr(r, 'email_send_error', None) for r in results],
+            aging_summaries=[r.aging_summary for r in results],
+            invoice_details_flat=invoice_details_flat,
+            invoice_offsets=invoice_offsets
+        )
+    
+    def to_aos(self) -> EscalationBatchResponse:
+        """
+        Reassemble the row-oriented batch response.
+        
+        Returns:
+            EscalationBatchResponse: Batch response with a list of escalation results
+        """
+        offsets = self.invoice_offsets
+        escalation_results = []
+        for i in range(len(self.accounts)):
+            common = dict(
+                account=self.accounts[i],
+                email_address=self.email_addresses[i],
+                email_subject=self.email_subjects[i],
+                email_body=self.email_bodies[i],
+                escalation_degree=self.escalation_degrees[i],
+                template_used=self.templates_used[i],
+                invoice_count=self.invoice_counts[i],
+                total_outstanding=self.total_outstandings[i],
+                invoice_details=self.invoice_details_flat[offsets[i]:offsets[i + 1]],
+                aging_summary=self.aging_summaries[i]
+            )
+            if self.emails_sent[i]:
+                result = EscalationResultSent.from_trusted(
+                    **common,
+                    email_sent_at=self.emails_sent_at[i],
+                    email_message_id=self.email_message_ids[i]
+                )
+            else:
+                result = EscalationResultPending.from_trusted(
+                    **common,
+                    email_send_error=self.email_send_errors[i]
+                )
+            escalation_results.append(result)
+        
+        return EscalationBatchResponse.model_construct(
+            success=self.success,
+            processed_count=self.processed_count,
+            emails_generated=self.emails_generated,
+            skipped_count=self.skipped_count,
+            escalation_results=escalation_results,
+            skipped_reasons=self.skipped_reasons,
+            processing_time_seconds=self.processing_time_seconds,
+            errors=self.errors,
+            email_sending_summary=self.email_sending_summary,
+            email_sending_details=self.email_sending_details
+        )
+
+
 class EscalationPreviewRequest(BaseModel):
     """Request schema for previewing escalation emails without sending."""
     
     contact_ready_clients: List[ContactReadyClient] = Field(
         ..., 
+        min_length=1,
         description="List of contact ready clients for preview"
     )
     
-    @validator('contact_ready_clients')
+    @validator('contact_ready_clients', pre=True)
     def validate_clients(cls, v):
-        """Ensure at least one client is provided."""
+        """Reject an empty client list before any client is validated."""
         if not v:
             raise ValueError('At least one contact ready client must be provided')
         return v
@@ -236,11 +410,6 @@ class EscalationStats(BaseModel):
     no_email_count: int = Field(..., description="Accounts without email addresses")
     processable_count: int = Field(..., description="Accounts that can be processed for escalation")
     total_outstanding: Decimal = Field(..., description="Total outstanding amount across all accounts")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: str(v)
-        }
 
 
 class EscalationAnalysisResponse(BaseModel):
@@ -1,33 +1,190 @@
+import asyncio
 import csv
 import io
-import time
 import re
-from typing import List, Dict, Any, Tuple
+import time
+from collections import defaultdict
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 from decimal import Decimal
-from datetime import datetime, date
+from datetime import date, datetime
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.attributes import set_committed_value
+from pydantic import TypeAdapter, ValidationError
 import structlog
 
 from app.schemas.csv_import import (
     CSVRowSchema, 
     ImportResultSchema, 
     ImportErrorSchema, 
-    ImportStatsSchema
+    ImportStatsSchema,
+    CreatedAgingSnapshot,
+    AgingSnapshotSummary,
+    ContactReadyClient
 )
 from app.repositories.account import AccountRepository
 from app.repositories.invoice import InvoiceRepository
 from app.repositories.invoice_aging_snapshot import InvoiceAgingSnapshotRepository
 from app.models.account import Account
+from app.models.contact import Contact
+from app.models.invoice import Invoice
+from app.models.invoice_aging_snapshot import InvoiceAgingSnapshot
 
 logger = structlog.get_logger()
 
+# Rows validated per pydantic-core call during import
+VALIDATION_CHUNK_SIZE = 5000
+CSV_ROWS_ADAPTER = TypeAdapter(List[CSVRowSchema])
+
+# Column mapping from CSV1 headers to schema fields
+CSV_COLUMN_MAPPING = {
+    'Client ID': 'client_id',
+    'Client Name': 'account_name', 
+    'Email Address': 'email',
+    'Invoice #': 'invoice_number',
+    'Invoice Date': 'invoice_date',
+    'Invoice Amount': 'invoice_amount',
+    'Current (0-30)': 'days_0_30',
+    '31-60 Days': 'days_31_60',
+    '61-90 Days': 'days_61_90', 
+    '91-120 Days': 'days_91_120',
+    '120+ Days': 'days_over_120',
+    'Total Outstanding': 'total_outstanding'
+}
+
+# Characters stripped from currency cells, and the plain amount left afterwards
+CURRENCY_STRIP_TABLE = str.maketrans('', '', '$, ')
+AMOUNT_RE = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+# Empty 31+ day buckets of an invoice that is only in the 0-30 bucket
+AGING_ZERO_TAIL = (Decimal('0'),) * 4
+
+# Separators in an email prefix that become spaces when deriving a contact name
+EMAIL_SEPARATOR_TABLE = str.maketrans('._-', '   ')
+
+# Rows parsed, validated and inserted per chunk during import
+IMPORT_CHUNK_SIZE = 1000
+
+# Row fields copied into each CreatedAgingSnapshot
+CREATED_SNAPSHOT_ROW_FIELDS = frozenset({
+    'invoice_number',
+    'invoice_date',
+    'total_outstanding',
+    'snapshot_date',
+    'days_0_30',
+    'days_31_60',
+    'days_61_90',
+    'days_91_120',
+    'days_over_120',
+})
+
+# Tables whose new rows are queued during the row loop, in insert order
+PENDING_INSERT_KEYS = ("accounts", "contacts", "invoices", "snapshots")
+
+# ImportStatsSchema counters advanced by _process_csv_row, restored when its records are rolled back
+ROW_STATS_COUNTERS = (
+    "accounts_found",
+    "accounts_created",
+    "contacts_created",
+    "invoices_found",
+    "invoices_created",
+    "invoices_updated",
+    "aging_snapshots_created",
+)
+
+
+def _clean_text(value: Optional[str]) -> Optional[str]:
+    """Strip a text cell; missing cells become None."""
+    return value.strip() if value else None
+
+
+def _clean_email(value: Optional[str]) -> Optional[str]:
+    """Strip an email cell; blank cells become None."""
+    return (value.strip() or None) if value else None
+
+
+def _parse_amount(value: Optional[str]) -> Any:
+    """Parse a currency cell; blank cells are zero, malformed text is left for validation to reject."""
+    value = _clean_text(value)
+    if not value:
+        return Decimal('0')
+    # Remove $, commas and spaces, then convert to Decimal
+    amount = value.translate(CURRENCY_STRIP_TABLE)
+    return Decimal(amount) if AMOUNT_RE.fullmatch(amount) else amount
+
+
+def _parse_invoice_date(value: Optional[str]) -> Any:
+    """Parse a YYYY-MM-DD date cell, leaving unparseable text for validation to reject."""
+    value = _clean_text(value)
+    if value:
+        # fromisoformat also accepts basic and week dates, so it only takes the
+        # exact YYYY-MM-DD shape; everything else keeps the strptime rules
+        if len(value) == 10 and value[4] == '-' and value[7] == '-':
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            pass
+    return value
+
+
+# Cell parsers by schema field; other mapped fields are stripped text
+CELL_PARSERS = {
+    'email': _clean_email,
+    'invoice_date': _parse_invoice_date,
+    'invoice_amount': _parse_amount,
+    'total_outstanding': _parse_amount,
+    'days_0_30': _parse_amount,
+    'days_31_60': _parse_amount,
+    'days_61_90': _parse_amount,
+    'days_91_120': _parse_amount,
+    'days_over_120': _parse_amount,
+}
+
+@lru_cache(maxsize=4096)
+def _derive_contact_name(email: Optional[str], account_name: str) -> Tuple[str, str]:
+    """
+    Derive a contact's first and last name from an email prefix or account name.
+    
+    Cached because every invoice row for a client repeats the same pair.
+    """
+    if email:
+        # Try to extract name from email prefix
+        email_prefix = email.split('@')[0] if '@' in email else email
+        # Convert email prefix to readable name (e.g., "accounting" -> "Accounting")
+        name_parts = email_prefix.translate(EMAIL_SEPARATOR_TABLE).split()
+        if name_parts:
+            first_name = name_parts[0].capitalize()
+            last_name = ' '.join(part.capitalize() for part in name_parts[1:]) if len(name_parts) > 1 else ''
+            return first_name, last_name
+    
+    # No usable email, use account name
+    name_parts = account_name.split()
+    first_name = name_parts[0] if name_parts else 'Contact'
+    last_name = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ''
+    return first_name, last_name
+
 
 class CSVImportService:
-    """Service for handling CSV import operations."""
+    """
+    Service for handling CSV import operations.
+    
+    Callers that can re-run an import may opt in to bulk_fast_commit. The
+    import transaction then runs with synchronous_commit off, so COMMIT does
+    not wait for the WAL flush. If the database server crashes right after
+    an import reports success, that import can be lost, though never
+    half-applied.
+    """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, bulk_fast_commit: bool = False):
         self.session = session
+        self.bulk_fast_commit = bulk_fast_commit
         self.account_repo = AccountRepository(session)
         self.invoice_repo = InvoiceRepository(session)
         self.aging_repo = InvoiceAgingSnapshotRepository(session)
@@ -46,41 +203,83 @@ class CSVImportService:
         stats = ImportStatsSchema()
         errors: List[ImportErrorSchema] = []
         successful_rows = 0
+        total_rows = 0
 
         try:
-            # Parse CSV content
-            csv_rows = self._parse_csv_content(csv_content)
-            total_rows = len(csv_rows)
+            logger.info("Starting CSV import")
 
-            logger.info("Starting CSV import", total_rows=total_rows)
+            if self.bulk_fast_commit:
+                # Scoped to this transaction only; other sessions are unaffected
+                await self.session.execute(text("SET LOCAL synchronous_commit = OFF"))
 
-            # Cache for accounts to avoid repeated DB queries
-            account_cache = {}
+            # Lookups preloaded per chunk and kept current as records are created
+            account_map: Dict[str, Account] = {}
+            invoice_map: Dict[str, Invoice] = {}
+            snapshot_map: Dict[str, InvoiceAgingSnapshot] = {}
 
-            # Process each row
-            for row_number, row_data in enumerate(csv_rows, start=1):
-                try:
-                    # Compute missing fields
-                    row_data = self._compute_missing_fields(row_data)
-                    
-                    # Validate row data
-                    validated_row = CSVRowSchema(**row_data)
-                    
-                    # Process the row with account cache
-                    await self._process_csv_row(validated_row, stats, account_cache)
-                    successful_rows += 1
-                    
-                except Exception as e:
-                    error = ImportErrorSchema(
-                        row_number=row_number,
-                        error_message=str(e),
-                        row_data=row_data
+            # Parse, validate and insert the file a chunk at a time so only one
+            # chunk of rows is held in memory
+            snapshot_date = date.today()
+            csv_rows = self._iter_csv_rows(csv_content)
+            while True:
+                # Parse, compute missing fields and validate the next chunk in a
+                # worker thread so the CPU-bound part doesn't block the event loop
+                chunk, validated_rows = await asyncio.to_thread(
+                    self._read_validated_chunk, csv_rows, snapshot_date
+                )
+                if not chunk:
+                    break
+                first_row_number = total_rows + 1
+                total_rows += len(chunk)
+                await self._preload_lookups(validated_rows, account_map, invoice_map, snapshot_map)
+
+                # New records are collected here and inserted in bulk after the chunk
+                pending_inserts = {key: [] for key in PENDING_INSERT_KEYS}
+                # Rows whose records were queued, kept in case they must be saved one by one
+                queued_rows: List[Tuple[int, Dict[str, Any], CSVRowSchema]] = []
+                stats_checkpoint = self._stats_checkpoint(stats)
+
+                # Process each row
+                for row_number, (row_data, validated_row) in enumerate(validated_rows, start=first_row_number):
+                    try:
+                        if isinstance(validated_row, Exception):
+                            raise validated_row
+                        
+                        # Process the row against the preloaded lookups
+                        await self._process_csv_row(
+                            validated_row, stats, account_map, invoice_map, snapshot_map,
+                            pending_inserts
+                        )
+                        queued_rows.append((row_number, row_data, validated_row))
+                        
+                    except Exception as e:
+                        # Built from our own values, so skip validation
+                        error = ImportErrorSchema.model_construct(
+                            row_number=row_number,
+                            error_message=str(e),
+                            row_data=row_data
+                        )
+                        errors.append(error)
+                        stats.validation_errors += 1
+                        logger.error("Row processing failed", 
+                                   row_number=row_number, 
+                                   error=str(e))
+
+                flush_error = await self._flush_in_savepoint(pending_inserts)
+                if flush_error is None:
+                    successful_rows += len(queued_rows)
+                else:
+                    # One bad record fails the whole chunk; undo it and save its rows one by one
+                    logger.warning("Chunk insert failed, retrying rows individually",
+                                 first_row=first_row_number,
+                                 last_row=total_rows,
+                                 error=str(flush_error))
+                    self._discard_pending_inserts(
+                        pending_inserts, stats, stats_checkpoint, account_map, invoice_map, snapshot_map
+                    )
+                    successful_rows += await self._insert_rows_individually(
+                        queued_rows, stats, errors, account_map, invoice_map, snapshot_map
                     )
-                    errors.append(error)
-                    stats.validation_errors += 1
-                    logger.error("Row processing failed", 
-                               row_number=row_number, 
-                               error=str(e))
 
             # Commit all changes
             await self.session.commit()
@@ -118,11 +317,12 @@ class CSVImportService:
             
             logger.error("CSV import failed", error=str(e))
             
+            # The rollback discards every row read so far, so all of them failed
             return ImportResultSchema(
                 success=False,
-                total_rows=0,
+                total_rows=total_rows,
                 successful_rows=0,
-                failed_rows=1,
+                failed_rows=total_rows,
                 errors=[ImportErrorSchema(
                     row_number=0,
                     error_message=f"Import failed: {str(e)}"
@@ -130,108 +330,121 @@ class CSVImportService:
                 processing_time_seconds=round(processing_time, 2)
             )
 
-    def _parse_csv_content(self, csv_content: str) -> List[Dict[str, Any]]:
-        """Parse CSV1.csv format and return list of row dictionaries."""
+    def _iter_csv_rows(self, csv_content: str) -> Iterator[Dict[str, Any]]:
+        """Parse CSV1.csv format and yield cleaned row dictionaries one at a time."""
         csv_file = io.StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
-        
-        # Column mapping from CSV1 headers to schema fields
-        column_mapping = {
-            'Client ID': 'client_id',
-            'Client Name': 'account_name', 
-            'Email Address': 'email',
-            'Invoice #': 'invoice_number',
-            'Invoice Date': 'invoice_date',
-            'Invoice Amount': 'invoice_amount',
-            'Current (0-30)': 'days_0_30',
-            '31-60 Days': 'days_31_60',
-            '61-90 Days': 'days_61_90', 
-            '91-120 Days': 'days_91_120',
-            '120+ Days': 'days_over_120',
-            'Total Outstanding': 'total_outstanding'
-        }
-        
-        rows = []
+        reader = csv.reader(csv_file)
+        
+        header = next(reader, None)
+        if not header:
+            return
+        
+        # Resolve mapped columns once: (csv index, schema field, cell parser).
+        # Unmapped and empty headers are skipped.
+        column_slots = [
+            (index, field, CELL_PARSERS.get(field, _clean_text))
+            for index, field in (
+                (index, CSV_COLUMN_MAPPING.get(name.strip())) for index, name in enumerate(header)
+            )
+            if field
+        ]
+        
         for row in reader:
-            cleaned_row = {}
+            if not row:  # Skip blank lines
+                continue
             
-            for csv_key, value in row.items():
-                if not csv_key:  # Skip empty keys
-                    continue
-                    
-                # Map CSV column name to schema field name
-                schema_field = column_mapping.get(csv_key.strip())
-                if not schema_field:
-                    continue  # Skip unmapped columns
-                
-                # Clean and process the value
-                cleaned_value = value.strip() if value else None
-                
-                # Handle empty email addresses
-                if schema_field == 'email' and not cleaned_value:
-                    cleaned_value = None
-                
-                # Parse currency values (remove $ and commas)
-                elif schema_field in ['invoice_amount', 'total_outstanding', 
-                                    'days_0_30', 'days_31_60', 'days_61_90', 
-                                    'days_91_120', 'days_over_120']:
-                    try:
-                        if cleaned_value:
-                            # Remove $ and commas, then convert to Decimal
-                            cleaned_value = cleaned_value.replace('$', '').replace(',', '')
-                            cleaned_value = Decimal(cleaned_value)
-                        else:
-                            cleaned_value = Decimal('0')
-                    except (ValueError, TypeError):
-                        cleaned_value = Decimal('0')
-                
-                # Convert date strings
-                elif schema_field == 'invoice_date':
-                    try:
-                        if cleaned_value:
-                            # Assuming YYYY-MM-DD format
-                            from datetime import datetime
-                            cleaned_value = datetime.strptime(cleaned_value, '%Y-%m-%d').date()
-                    except (ValueError, TypeError):
-                        # If date parsing fails, let validation catch it
-                        pass
-                
-                cleaned_row[schema_field] = cleaned_value
+            # Missing trailing cells are treated as empty
+            width = len(row)
+            cleaned_row = {
+                field: parse(row[index] if index < width else None)
+                for index, field, parse in column_slots
+            }
             
             # Only add non-empty rows that have required fields
             if cleaned_row and cleaned_row.get('client_id') and cleaned_row.get('invoice_number'):
-                rows.append(cleaned_row)
+                yield cleaned_row
+
+    def _read_validated_chunk(
+        self, 
+        csv_rows: Iterator[Dict[str, Any]], 
+        snapshot_date: date
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[Dict[str, Any], Any]]]:
+        """Pull the next IMPORT_CHUNK_SIZE rows and validate them."""
+        chunk = list(islice(csv_rows, IMPORT_CHUNK_SIZE))
+        return chunk, self._validate_rows(chunk, snapshot_date)
+
+    def _validate_rows(
+        self, 
+        csv_rows: List[Dict[str, Any]], 
+        snapshot_date: date
+    ) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Compute missing fields and validate rows a chunk at a time.
+        
+        Each chunk is validated by a single list TypeAdapter call so pydantic-core
+        loops over the rows natively. If a chunk fails, the error locations
+        identify the invalid rows; the rest are validated again as one batch and
+        only the invalid rows are re-validated individually for their messages.
         
-        return rows
+        Args:
+            csv_rows: Parsed CSV rows
+            snapshot_date: Aging snapshot date shared by every row of the import
+            
+        Returns:
+            List of (row_data, CSVRowSchema or the exception raised for that row)
+        """
+        results: List[Tuple[Dict[str, Any], Any]] = []
+        
+        for start in range(0, len(csv_rows), VALIDATION_CHUNK_SIZE):
+            chunk = []
+            for row_data in csv_rows[start:start + VALIDATION_CHUNK_SIZE]:
+                try:
+                    chunk.append(self._compute_missing_fields(row_data, snapshot_date))
+                except Exception as e:
+                    chunk.append(e)
+            
+            # Rows whose missing fields could not be computed are reported as-is
+            failed = {index for index, row in enumerate(chunk) if isinstance(row, Exception)}
+            candidates = [index for index in range(len(chunk)) if index not in failed]
+            
+            try:
+                validated = CSV_ROWS_ADAPTER.validate_python([chunk[index] for index in candidates])
+            except ValidationError as e:
+                # Errors are located by list index; only those rows are invalid
+                failed.update(candidates[error['loc'][0]] for error in e.errors())
+                candidates = [index for index in candidates if index not in failed]
+                validated = CSV_ROWS_ADAPTER.validate_python([chunk[index] for index in candidates])
+            
+            row_results: Dict[int, Any] = dict(zip(candidates, validated))
+            for index in failed:
+                row_data = chunk[index]
+                if isinstance(row_data, Exception):
+                    row_results[index] = row_data
+                    continue
+                # Re-validate the failing row alone for a row-level error message
+                try:
+                    row_results[index] = CSVRowSchema(**row_data)
+                except Exception as row_error:
+                    row_results[index] = row_error
+            
+            originals = csv_rows[start:start + VALIDATION_CHUNK_SIZE]
+            for index, row_data in enumerate(chunk):
+                if isinstance(row_data, Exception):
+                    row_data = originals[index]
+                results.append((row_data, row_results[index]))
+        
+        return results
 
-    def _compute_missing_fields(self, row_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _compute_missing_fields(self, row_data: Dict[str, Any], snapshot_date: date) -> Dict[str, Any]:
         """Compute missing fields for CSV1 format."""
         
-        # Set snapshot_date to current date
-        row_data['snapshot_date'] = date.today()
+        # Set snapshot_date to the import date
+        row_data['snapshot_date'] = snapshot_date
         
         # Extract contact name from email or use account name
-        email = row_data.get('email')
-        account_name = row_data.get('account_name', '')
-        
-        if email:
-            # Try to extract name from email prefix
-            email_prefix = email.split('@')[0] if '@' in email else email
-            # Convert email prefix to readable name (e.g., "accounting" -> "Accounting")
-            name_parts = re.sub(r'[._-]', ' ', email_prefix).split()
-            if name_parts:
-                first_name = name_parts[0].capitalize()
-                last_name = ' '.join(part.capitalize() for part in name_parts[1:]) if len(name_parts) > 1 else ''
-            else:
-                # Fallback to account name
-                name_parts = account_name.split()
-                first_name = name_parts[0] if name_parts else 'Contact'
-                last_name = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ''
-        else:
-            # No email, use account name
-            name_parts = account_name.split()
-            first_name = name_parts[0] if name_parts else 'Contact'
-            last_name = ' '.join(name_parts[1:]) if len(name_parts) > 1 else ''
+        first_name, last_name = _derive_contact_name(
+            row_data.get('email'), row_data.get('account_name', '')
+        )
         
         # Set computed contact fields
         row_data['first_name'] = first_name
@@ -243,57 +456,39 @@ class CSVImportService:
 
     def _aging_values_changed(self, existing_snapshot, new_snapshot_data: Dict[str, Any]) -> bool:
         """Compare aging bucket values to determine if a new snapshot is needed."""
-        aging_fields = ['days_0_30', 'days_31_60', 'days_61_90', 'days_91_120', 'days_over_120']
-        
-        for field in aging_fields:
-            existing_value = getattr(existing_snapshot, field)
-            new_value = new_snapshot_data[field]
-            
-            # Convert to Decimal for accurate comparison if needed
-            if existing_value != new_value:
-                logger.info("Aging value changed", 
-                           field=field, 
-                           existing_value=existing_value, 
-                           new_value=new_value,
-                           invoice_id=existing_snapshot.invoice_id)
-                return True
-        
-        return False
+        return (
+            existing_snapshot.days_0_30,
+            existing_snapshot.days_31_60,
+            existing_snapshot.days_61_90,
+            existing_snapshot.days_91_120,
+            existing_snapshot.days_over_120
+        ) != (
+            new_snapshot_data['days_0_30'],
+            new_snapshot_data['days_31_60'],
+            new_snapshot_data['days_61_90'],
+            new_snapshot_data['days_91_120'],
+            new_snapshot_data['days_over_120']
+        )
 
     def _invoice_values_changed(self, existing_invoice, new_invoice_data: Dict[str, Any]) -> bool:
         """Compare invoice amounts to determine if an update is needed."""
-        invoice_fields = ['invoice_amount', 'total_outstanding']
-        
-        for field in invoice_fields:
-            existing_value = getattr(existing_invoice, field)
-            new_value = new_invoice_data[field]
-            
-            # Convert to Decimal for accurate comparison if needed
-            if existing_value != new_value:
-                logger.info("Invoice value changed", 
-                           field=field, 
-                           existing_value=existing_value, 
-                           new_value=new_value,
-                           invoice_number=existing_invoice.invoice_number)
-                return True
-        
-        return False
+        return (
+            existing_invoice.invoice_amount,
+            existing_invoice.total_outstanding
+        ) != (
+            new_invoice_data['invoice_amount'],
+            new_invoice_data['total_outstanding']
+        )
 
-    async def _build_contact_ready_clients(self, created_aging_snapshots: List[Dict[str, Any]]) -> List:
+    async def _build_contact_ready_clients(self, created_aging_snapshots: List[CreatedAgingSnapshot]) -> List:
         """Build contact_ready_clients list from created aging snapshots."""
-        from app.schemas.csv_import import ContactReadyClient, AgingSnapshotSummary
-        from decimal import Decimal
-        
         if not created_aging_snapshots:
             return []
         
         # Group snapshots by account_id
-        snapshots_by_account = {}
+        snapshots_by_account = defaultdict(list)
         for snapshot in created_aging_snapshots:
-            account_id = snapshot["account_id"]
-            if account_id not in snapshots_by_account:
-                snapshots_by_account[account_id] = []
-            snapshots_by_account[account_id].append(snapshot)
+            snapshots_by_account[snapshot.account_id].append(snapshot)
         
         # Get account and contact information
         account_ids = list(snapshots_by_account.keys())
@@ -317,22 +512,22 @@ class CSVImportService:
                     primary_contact = account.contacts[0]
             
             # Build aging snapshot summaries
-            aging_snapshots = []
-            total_outstanding = Decimal('0')
-            
-            for snapshot in account_snapshots:
-                aging_summary = AgingSnapshotSummary(
-                    invoice_number=snapshot["invoice_number"],
-                    invoice_date=snapshot["invoice_date"],
-                    snapshot_date=snapshot["snapshot_date"],
-                    days_0_30=snapshot["days_0_30"],
-                    days_31_60=snapshot["days_31_60"],
-                    days_61_90=snapshot["days_61_90"],
-                    days_91_120=snapshot["days_91_120"],
-                    days_over_120=snapshot["days_over_120"]
+            aging_snapshots = [
+                AgingSnapshotSummary.model_construct(
+                    invoice_number=snapshot.invoice_number,
+                    invoice_date=snapshot.invoice_date,
+                    snapshot_date=snapshot.snapshot_date,
+                    days_0_30=snapshot.days_0_30,
+                    days_31_60=snapshot.days_31_60,
+                    days_61_90=snapshot.days_61_90,
+                    days_91_120=snapshot.days_91_120,
+                    days_over_120=snapshot.days_over_120
                 )
-                aging_snapshots.append(aging_summary)
-                total_outstanding += snapshot["total_outstanding"]
+                for snapshot in account_snapshots
+            ]
+            total_outstanding = sum(
+                (snapshot.total_outstanding for snapshot in account_snapshots), Decimal('0')
+            )
             
             # Calculate DNC status
             dnc_status = self._calculate_dnc_status(primary_contact, aging_snapshots)
@@ -357,85 +552,84 @@ class CSVImportService:
         if not contact or not contact.email:
             return True
         
-        # Check if ALL snapshots have value only in days_0_30 bucket
-        for snapshot in aging_snapshots:
-            if (snapshot.days_0_30 > 0 and 
-                snapshot.days_31_60 == 0 and 
-                snapshot.days_61_90 == 0 and 
-                snapshot.days_91_120 == 0 and 
-                snapshot.days_over_120 == 0):
-                return True  # Fresh invoice (0-30 days only) = DNC
-        
-        return False  # Has email and has aged invoices = contact ready
+        # Any fresh invoice (value only in the 0-30 bucket) = DNC,
+        # otherwise has email and has aged invoices = contact ready
+        return any(
+            snapshot.days_0_30 > 0 and (
+                snapshot.days_31_60,
+                snapshot.days_61_90,
+                snapshot.days_91_120,
+                snapshot.days_over_120
+            ) == AGING_ZERO_TAIL
+            for snapshot in aging_snapshots
+        )
 
-    async def _process_csv_row(self, row: CSVRowSchema, stats: ImportStatsSchema, account_cache: Dict[str, Account]) -> None:
-        """Process a single CSV row and create/update records."""
+    async def _process_csv_row(
+        self, 
+        row: CSVRowSchema, 
+        stats: ImportStatsSchema, 
+        account_map: Dict[str, Account],
+        invoice_map: Dict[str, Invoice],
+        snapshot_map: Dict[str, InvoiceAgingSnapshot],
+        pending_inserts: Dict[str, List[dict]]
+    ) -> None:
+        """
+        Process a single CSV row and create/update records.
+        
+        The lookup maps are preloaded by import_csv_data and kept current here,
+        so records created by earlier rows are found by later ones. New records
+        get their IDs client-side and are queued in pending_inserts rather than
+        inserted one by one.
+        """
         try:
-            # 1. Handle Account (check cache first)
-            if row.client_id in account_cache:
-                account = account_cache[row.client_id]
+            # 1. Handle Account
+            account = account_map.get(row.client_id)
+            
+            if account:
                 stats.accounts_found += 1
-                logger.info("Using cached account", 
-                           client_id=row.client_id,
-                           account_id=account.id)
+                account_action = "found"
             else:
-                account = await self.account_repo.get_by_client_id(row.client_id)
-            
-            if not account:
                 # Create new account with contact
-                account_data = {
-                    "client_id": row.client_id,
-                    "account_name": row.account_name
-                }
-                
-                contact_data = {
-                    "first_name": row.first_name,
-                    "last_name": row.last_name,
-                    **({'email': str(row.email)} if getattr(row, 'email', None) is not None else {}),
-                    "phone": row.phone,
-                    "is_billing_contact": row.is_billing_contact
-                }
+                account = Account(
+                    client_id=row.client_id,
+                    account_name=row.account_name
+                )
                 
-                account, contact = await self.account_repo.create_with_contact(
-                    account_data, contact_data
+                contact = Contact(
+                    account_id=account.id,
+                    first_name=row.first_name,
+                    last_name=row.last_name,
+                    email=str(row.email) if row.email is not None else None,
+                    phone=row.phone,
+                    is_billing_contact=row.is_billing_contact
                 )
+                
+                pending_inserts["accounts"].append(account.model_dump())
+                pending_inserts["contacts"].append(contact.model_dump())
                 stats.accounts_created += 1
                 stats.contacts_created += 1
                 
-                # Add to cache for future rows
-                account_cache[row.client_id] = account
-                
-                logger.info("Created new account and contact", 
-                           client_id=row.client_id,
-                           account_id=account.id)
-            else:
-                # Account exists, add to cache if not already there
-                if row.client_id not in account_cache:
-                    account_cache[row.client_id] = account
-                    stats.accounts_found += 1
-                    logger.info("Reusing existing account", 
-                               client_id=row.client_id,
-                               account_id=account.id)
+                # Make the account visible to later rows
+                account_map[row.client_id] = account
+                account_action = "created"
 
             # 2. Handle Invoice
-            invoice = await self.invoice_repo.get_by_invoice_number(row.invoice_number)
+            invoice = invoice_map.get(row.invoice_number)
             
             if not invoice:
                 # Create new invoice
-                invoice_data = {
-                    "account_id": account.id,
-                    "invoice_number": row.invoice_number,
-                    "invoice_date": row.invoice_date,
-                    "invoice_amount": row.invoice_amount,
-                    "total_outstanding": row.total_outstanding
-                }
+                invoice = Invoice(
+                    account_id=account.id,
+                    invoice_number=row.invoice_number,
+                    invoice_date=row.invoice_date,
+                    invoice_amount=row.invoice_amount,
+                    total_outstanding=row.total_outstanding
+                )
                 
-                invoice = await self.invoice_repo.create_invoice(invoice_data)
+                pending_inserts["invoices"].append(invoice.model_dump())
+                invoice_map[row.invoice_number] = invoice
                 stats.invoices_created += 1
-                
-                logger.info("Created new invoice", 
-                           invoice_number=row.invoice_number,
-                           invoice_id=invoice.id)
+                invoice_action = "created"
             else:
                 # Check if invoice amounts have changed
                 invoice_update_data = {
@@ -444,24 +638,25 @@ class CSVImportService:
                 }
                 
                 if self._invoice_values_changed(invoice, invoice_update_data):
-                    # Update existing invoice with new amounts
-                    await self.invoice_repo.update_invoice(invoice, invoice_update_data)
+                    # Queue the new amounts for the chunk's invoice upsert. The
+                    # values are set as already committed so later rows compare
+                    # against them without the ORM issuing its own UPDATE.
+                    for field, value in invoice_update_data.items():
+                        set_committed_value(invoice, field, value)
+                    pending_inserts["invoices"].append(invoice.model_dump())
                     stats.invoices_updated += 1
-                    
-                    logger.info("Updated invoice amounts", 
-                               invoice_number=row.invoice_number,
-                               invoice_id=invoice.id)
+                    invoice_action = "updated"
                 else:
                     # Invoice amounts unchanged, just track as found
                     stats.invoices_found += 1
+                    invoice_action = "unchanged"
                     
                 # Check if it's a duplicate in this import
-                if row.invoice_number not in stats.duplicate_invoice_numbers:
-                    stats.duplicate_invoice_numbers.append(row.invoice_number)
+                stats.duplicate_invoice_numbers.add(row.invoice_number)
 
             # 3. Handle Aging Snapshot
             # Get the most recent aging snapshot for this invoice (regardless of date)
-            latest_snapshot = await self.aging_repo.get_latest_snapshot_by_invoice(invoice.id)
+            latest_snapshot = snapshot_map.get(invoice.id)
             
             # Prepare snapshot data for comparison/creation
             snapshot_data = {
@@ -476,52 +671,192 @@ class CSVImportService:
             
             # Create new snapshot if no previous snapshot exists or values have changed
             if not latest_snapshot or self._aging_values_changed(latest_snapshot, snapshot_data):
-                await self.aging_repo.create_snapshot(snapshot_data)
+                snapshot = InvoiceAgingSnapshot(**snapshot_data)
+                pending_inserts["snapshots"].append(snapshot.model_dump())
+                snapshot_map[invoice.id] = snapshot
                 stats.aging_snapshots_created += 1
                 
-                # Track created aging snapshot details for contact_ready_clients
-                created_snapshot_details = {
-                    "account_id": account.id,
-                    "account_name": account.account_name,
-                    "invoice_id": invoice.id,
-                    "invoice_number": row.invoice_number,
-                    "invoice_date": row.invoice_date,
-                    "total_outstanding": row.total_outstanding,
-                    "snapshot_date": row.snapshot_date,
-                    "days_0_30": row.days_0_30,
-                    "days_31_60": row.days_31_60,
-                    "days_61_90": row.days_61_90,
-                    "days_91_120": row.days_91_120,
-                    "days_over_120": row.days_over_120
-                }
+                # Track created aging snapshot details for contact_ready_clients.
+                # Values come from the already validated row, so skip re-validation.
+                created_snapshot_details = CreatedAgingSnapshot.model_construct(
+                    account_id=account.id,
+                    account_name=account.account_name,
+                    invoice_id=invoice.id,
+                    **row.model_dump(include=CREATED_SNAPSHOT_ROW_FIELDS)
+                )
                 stats.created_aging_snapshots.append(created_snapshot_details)
-                
-                if latest_snapshot:
-                    logger.info("Created new aging snapshot with changed values", 
-                               invoice_id=invoice.id,
-                               snapshot_date=row.snapshot_date)
-                else:
-                    logger.info("Created first aging snapshot for invoice", 
-                               invoice_id=invoice.id,
-                               snapshot_date=row.snapshot_date)
+                snapshot_action = "changed" if latest_snapshot else "first"
             else:
                 # Values unchanged from latest snapshot, skip creation
-                logger.info("Skipped aging snapshot - values unchanged from latest", 
-                           invoice_id=invoice.id,
-                           snapshot_date=row.snapshot_date)
+                snapshot_action = "skipped"
+            
+            # One event per row summarizing what happened
+            logger.debug("CSV row processed",
+                        client_id=row.client_id,
+                        invoice_number=row.invoice_number,
+                        account=account_action,
+                        invoice=invoice_action,
+                        snapshot=snapshot_action)
 
         except IntegrityError as e:
-            await self.session.rollback()
             stats.database_errors += 1
             logger.error("Database integrity error", error=str(e))
             raise Exception(f"Database error: {str(e)}")
         
         except Exception as e:
-            await self.session.rollback()
             stats.database_errors += 1
             logger.error("Unexpected error processing row", error=str(e))
             raise
 
+    async def _preload_lookups(
+        self,
+        validated_rows: List[Tuple[Dict[str, Any], Any]],
+        account_map: Dict[str, Account],
+        invoice_map: Dict[str, Invoice],
+        snapshot_map: Dict[str, InvoiceAgingSnapshot]
+    ) -> None:
+        """
+        Load the accounts, invoices and latest snapshots a chunk refers to.
+        
+        Keys already in the maps from earlier chunks are not queried again, so
+        each chunk costs at most three SELECTs regardless of its size.
+        """
+        valid_rows = [row for _, row in validated_rows if not isinstance(row, Exception)]
+        
+        account_map.update(await self.account_repo.get_by_client_ids(
+            {row.client_id for row in valid_rows} - account_map.keys()
+        ))
+        new_invoices = await self.invoice_repo.get_by_invoice_numbers(
+            {row.invoice_number for row in valid_rows} - invoice_map.keys()
+        )
+        invoice_map.update(new_invoices)
+        snapshot_map.update(await self.aging_repo.get_latest_snapshots_by_invoice_ids(
+            {invoice.id for invoice in new_invoices.values()}
+        ))
+
+    async def _flush_pending_inserts(self, pending_inserts: Dict[str, List[dict]]) -> None:
+        """Insert the records queued by _process_csv_row in foreign-key order."""
+        await self.account_repo.bulk_create_with_contacts(
+            pending_inserts["accounts"], pending_inserts["contacts"]
+        )
+        await self.invoice_repo.bulk_upsert(pending_inserts["invoices"])
+        await self.aging_repo.bulk_copy(pending_inserts["snapshots"])
+        
+        logger.info("Inserted pending import records",
+                   **{key: len(records) for key, records in pending_inserts.items()})
+
+    async def _flush_in_savepoint(self, pending_inserts: Dict[str, List[dict]]) -> Optional[Exception]:
+        """
+        Insert queued records inside a SAVEPOINT.
+        
+        Returns:
+            The database error if the records were rejected and rolled back, else None
+        """
+        try:
+            async with self.session.begin_nested():
+                await self._flush_pending_inserts(pending_inserts)
+        except Exception as e:
+            return e
+        return None
+
+    def _stats_checkpoint(self, stats: ImportStatsSchema) -> Tuple[Tuple[int, ...], int, Set[str]]:
+        """Capture the stats _process_csv_row advances, for _discard_pending_inserts."""
+        return (
+            tuple(getattr(stats, name) for name in ROW_STATS_COUNTERS),
+            len(stats.created_aging_snapshots),
+            set(stats.duplicate_invoice_numbers)
+        )
+
+    def _discard_pending_inserts(
+        self,
+        pending_inserts: Dict[str, List[dict]],
+        stats: ImportStatsSchema,
+        stats_checkpoint: Tuple[Tuple[int, ...], int, Set[str]],
+        account_map: Dict[str, Account],
+        invoice_map: Dict[str, Invoice],
+        snapshot_map: Dict[str, InvoiceAgingSnapshot]
+    ) -> None:
+        """
+        Forget queued records whose insert was rolled back.
+        
+        Stats go back to the checkpoint, and every lookup entry the records
+        touched is dropped, so later rows load the current rows from the
+        database again instead of referring to records that were never saved.
+        """
+        counters, created_snapshot_count, duplicate_invoice_numbers = stats_checkpoint
+        for name, value in zip(ROW_STATS_COUNTERS, counters):
+            setattr(stats, name, value)
+        del stats.created_aging_snapshots[created_snapshot_count:]
+        stats.duplicate_invoice_numbers = duplicate_invoice_numbers
+        
+        for record in pending_inserts["accounts"]:
+            account_map.pop(record["client_id"], None)
+        
+        # An invoice and its latest snapshot are reloaded together
+        invoice_numbers = {record["invoice_number"] for record in pending_inserts["invoices"]}
+        snapshot_invoice_ids = {record["invoice_id"] for record in pending_inserts["snapshots"]}
+        if snapshot_invoice_ids:
+            invoice_numbers.update(
+                number for number, invoice in invoice_map.items() if invoice.id in snapshot_invoice_ids
+            )
+        for number in invoice_numbers:
+            invoice = invoice_map.pop(number, None)
+            if invoice is None:
+                continue
+            snapshot_map.pop(invoice.id, None)
+            # Loaded invoices may carry queued amounts; drop them so a reload reads the database
+            if invoice in self.session:
+                self.session.expunge(invoice)
+
+    async def _insert_rows_individually(
+        self,
+        queued_rows: List[Tuple[int, Dict[str, Any], CSVRowSchema]],
+        stats: ImportStatsSchema,
+        errors: List[ImportErrorSchema],
+        account_map: Dict[str, Account],
+        invoice_map: Dict[str, Invoice],
+        snapshot_map: Dict[str, InvoiceAgingSnapshot]
+    ) -> int:
+        """
+        Save the rows of a chunk whose bulk insert failed one at a time.
+        
+        Each row is flushed in its own savepoint, so only the rows the database
+        rejects are reported, with their row numbers.
+        
+        Returns:
+            int: Number of rows saved
+        """
+        saved_rows = 0
+        for row_number, row_data, row in queued_rows:
+            stats_checkpoint = self._stats_checkpoint(stats)
+            pending_inserts = {key: [] for key in PENDING_INSERT_KEYS}
+            await self._preload_lookups([(row_data, row)], account_map, invoice_map, snapshot_map)
+            
+            try:
+                await self._process_csv_row(
+                    row, stats, account_map, invoice_map, snapshot_map, pending_inserts
+                )
+                error = await self._flush_in_savepoint(pending_inserts)
+            except Exception as e:
+                error = e
+            
+            if error is None:
+                saved_rows += 1
+                continue
+            
+            self._discard_pending_inserts(
+                pending_inserts, stats, stats_checkpoint, account_map, invoice_map, snapshot_map
+            )
+            stats.database_errors += 1
+            errors.append(ImportErrorSchema.model_construct(
+                row_number=row_number,
+                error_message=f"Database error: {error}",
+                row_data=row_data
+            ))
+            logger.error("Row insert failed", row_number=row_number, error=str(error))
+        
+        return saved_rows
+
     async def validate_csv_format(self, csv_content: str) -> Tuple[bool, List[str]]:
         """
         Validate CSV1.csv format and required columns.
@@ -1,7 +1,9 @@
 import html
 import re
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Tuple
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 import structlog
 
@@ -11,14 +13,74 @@ from app.schemas.email_template import (
     EmailTemplateData,
     EmailTemplateCreate,
     EmailTemplateUpdate,
-    EmailTemplateSummary
+    EmailTemplateSummary,
+    parse_template_data
 )
 
 logger = structlog.get_logger()
 
+# Patterns stripped from template bodies by _sanitize_html
+_SCRIPT_RE = re.compile(r'<script\b.*?</script>', re.IGNORECASE | re.DOTALL)
+_EVENT_ATTR_RE = re.compile(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', re.IGNORECASE)
+_JS_PROTOCOL_RE = re.compile(r'javascript:', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _sanitize_html(html_content: str) -> str:
+    """
+    Basic HTML sanitization to remove dangerous elements.
+    
+    Pure, so results are cached per body; the bound keeps memory in check
+    since bodies can be up to 50,000 characters.
+    
+    Args:
+        html_content: HTML content to sanitize
+        
+    Returns:
+        str: Sanitized HTML content
+    """
+    # Plain substring scans rule out clean bodies before any regex runs. They
+    # are only exact for ASCII text, since IGNORECASE also matches characters
+    # such as U+017F (long s) against 's'.
+    # Event attributes are stripped even from text without any tags.
+    if html_content.isascii():
+        lowered = html_content.lower()
+        has_script = '<script' in lowered
+        has_event_attr = 'on' in lowered and '=' in html_content
+        has_js_protocol = 'javascript:' in lowered
+    else:
+        has_script = has_event_attr = has_js_protocol = True
+    
+    # Remove script tags and their content
+    if has_script:
+        html_content = _SCRIPT_RE.sub('', html_content)
+    
+    # Remove dangerous attributes (onclick, onload, etc.)
+    if has_event_attr:
+        html_content = _EVENT_ATTR_RE.sub('', html_content)
+    
+    # Remove javascript: protocol
+    if has_js_protocol:
+        html_content = _JS_PROTOCOL_RE.sub('', html_content)
+    
+    return html_content
+
+
+def _summary_json(identifier: str, template_data: EmailTemplateData) -> str:
+    """Serialize the EmailTemplateSummary payload served by the summary endpoint."""
+    return EmailTemplateSummary.model_construct(
+        identifier=identifier,
+        template_data=template_data
+    ).model_dump_json()
+
 
 class EmailTemplateService:
-    """Service for handling email template operations with versioning."""
+    """
+    Service for handling email template operations with versioning.
+    
+    Mutators only flush; the caller owns the transaction and commits once,
+    e.g. with ``async with session.begin():`` around one or many calls.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -40,31 +102,17 @@ class EmailTemplateService:
         try:
             # Validate and sanitize template data
             validated_data = self._validate_and_sanitize_template_data(template_data.data)
+            template_json = {"subject": validated_data.subject, "body": validated_data.body}
+            
+            # Insert the next version (1 for a new identifier) in a single statement
+            logger.info("Creating template version", 
+                       identifier=template_data.identifier)
+            new_template = await self.template_repo.upsert_new_version(
+                template_data.identifier, 
+                template_json,
+                _summary_json(template_data.identifier, validated_data)
+            )
             
-            # Check if template with this identifier already exists
-            existing_template = await self.template_repo.get_latest_version(template_data.identifier)
-            
-            if existing_template:
-                # Create new version
-                logger.info("Creating new version of existing template", 
-                           identifier=template_data.identifier)
-                new_template = await self.template_repo.create_new_version(
-                    template_data.identifier, 
-                    validated_data.dict()
-                )
-            else:
-                # Create first version
-                logger.info("Creating new template", 
-                           identifier=template_data.identifier)
-                template_dict = {
-                    "identifier": template_data.identifier,
-                    "version": 1,
-                    "data": validated_data.dict(),
-                    "is_active": True
-                }
-                new_template = await self.template_repo.create(template_dict)
-            
-            await self.session.commit()
             logger.info("Template created successfully", 
                        template_id=new_template.id,
                        identifier=new_template.identifier,
@@ -73,12 +121,14 @@ class EmailTemplateService:
             return new_template
             
         except IntegrityError as e:
-            await self.session.rollback()
-            logger.error("Database integrity error creating template", error=str(e))
-            raise ValueError(f"Failed to create template: {str(e)}")
-        except Exception as e:
-            await self.session.rollback()
-            logger.error("Unexpected error creating template", error=str(e))
+            logger.error("Database integrity error creating template", 
+                        identifier=template_data.identifier,
+                        exc_info=True)
+            raise ValueError(f"Failed to create template: {e.orig}")
+        except Exception:
+            logger.error("Unexpected error creating template", 
+                        identifier=template_data.identifier,
+                        exc_info=True)
             raise
 
     async def update_template(self, identifier: str, update_data: EmailTemplateUpdate) -> Tuple[EmailTemplate, int]:
@@ -108,12 +158,12 @@ class EmailTemplateService:
             previous_version = existing_template.version
             
             # Create new version
-            new_template = await self.template_repo.create_new_version(
+            new_template = await self.template_repo.upsert_new_version(
                 identifier, 
-                validated_data.dict()
+                {"subject": validated_data.subject, "body": validated_data.body},
+                _summary_json(identifier, validated_data)
             )
             
-            await self.session.commit()
             logger.info("Template updated successfully", 
                        template_id=new_template.id,
                        identifier=identifier,
@@ -123,12 +173,14 @@ class EmailTemplateService:
             return new_template, previous_version
             
         except IntegrityError as e:
-            await self.session.rollback()
-            logger.error("Database integrity error updating template", error=str(e))
-            raise ValueError(f"Failed to update template: {str(e)}")
-        except Exception as e:
-            await self.session.rollback()
-            logger.error("Unexpected error updating template", error=str(e))
+            logger.error("Database integrity error updating template", 
+                        identifier=identifier,
+                        exc_info=True)
+            raise ValueError(f"Failed to update template: {e.orig}")
+        except Exception:
+            logger.error("Unexpected error updating template", 
+                        identifier=identifier,
+                        exc_info=True)
             raise
 
     async def get_template(self, identifier: str) -> Optional[EmailTemplate]:
@@ -139,9 +191,9 @@ class EmailTemplateService:
         """Get a specific version of a template."""
         return await self.template_repo.get_by_identifier_and_version(identifier, version)
 
-    async def get_template_versions(self, identifier: str) -> List[EmailTemplate]:
-        """Get all versions of a template."""
-        return await self.template_repo.get_versions_by_identifier(identifier)
+    async def get_template_versions(self, identifier: str) -> List[Row]:
+        """Get version metadata (id, version, is_active, timestamps) for all versions of a template."""
+        return await self.template_repo.get_version_rows_by_identifier(identifier)
 
     async def get_all_templates(self, skip: int = 0, limit: int = 100) -> Tuple[List[EmailTemplate], int]:
         """
@@ -150,37 +202,59 @@ class EmailTemplateService:
         Returns:
             Tuple[List[EmailTemplate], int]: Templates and total count
         """
-        all_templates = await self.template_repo.get_all_latest_versions()
-        total = len(all_templates)
-        
-        # Apply pagination
-        paginated_templates = all_templates[skip:skip + limit]
-        
-        return paginated_templates, total
+        return await self.template_repo.get_latest_versions_paginated(skip=skip, limit=limit)
 
-    async def get_latest_templates_summary(self) -> List[EmailTemplateSummary]:
+    async def get_latest_templates_summary(
+        self, 
+        identifier_prefix: Optional[str] = None
+    ) -> List[EmailTemplateSummary]:
         """
         Get latest version of each template in summary format.
         
+        Args:
+            identifier_prefix: Only include identifiers starting with this prefix
+        
         Returns:
             List[EmailTemplateSummary]: List of template summaries
         """
-        latest_templates = await self.template_repo.get_all_latest_versions()
+        # Only the identifier and data columns are needed, not full ORM rows
+        latest_summaries = await self.template_repo.get_latest_summaries(identifier_prefix)
         
-        summaries = []
-        for template in latest_templates:
-            # Convert data dict to EmailTemplateData for validation
-            template_data = EmailTemplateData(**template.data)
-            
-            summary = EmailTemplateSummary(
-                identifier=template.identifier,
-                template_data=template_data
+        # The data is validated (memoized per content), so the summary wrapper
+        # itself doesn't need validating again
+        summaries = [
+            EmailTemplateSummary.model_construct(
+                identifier=identifier,
+                template_data=parse_template_data(data)
             )
-            summaries.append(summary)
+            for identifier, data, _ in latest_summaries
+        ]
         
         logger.info("Retrieved template summaries", count=len(summaries))
         return summaries
 
+    async def get_latest_templates_summary_json(self) -> Tuple[bytes, int]:
+        """
+        Get latest version of each template as a serialized summary list.
+        
+        Summaries are serialized when a version is written, so this only
+        joins the stored payloads; rows without one are serialized here.
+        
+        Returns:
+            Tuple[bytes, int]: JSON array of EmailTemplateSummary objects and
+            the number of summaries in it
+        """
+        latest_summaries = await self.template_repo.get_latest_summaries()
+        
+        payloads = [
+            summary_json if summary_json is not None
+            else _summary_json(identifier, parse_template_data(data))
+            for identifier, data, summary_json in latest_summaries
+        ]
+        
+        logger.info("Retrieved template summaries", count=len(payloads))
+        return f"[{','.join(payloads)}]".encode(), len(payloads)
+
     async def activate_version(self, identifier: str, version: int) -> Tuple[Optional[EmailTemplate], Optional[int]]:
         """
         Activate a specific version of a template.
@@ -196,17 +270,14 @@ class EmailTemplateService:
             ValueError: If template or version not found
         """
         try:
-            # Get current active version
-            current_active = await self.template_repo.get_latest_version(identifier)
-            previous_version = current_active.version if current_active else None
-            
-            # Activate the requested version
-            activated_template = await self.template_repo.activate_version(identifier, version)
+            # Activate the requested version; the previous active version comes back with it
+            activated_template, previous_version = await self.template_repo.activate_version(
+                identifier, version
+            )
             
             if not activated_template:
                 raise ValueError(f"Template '{identifier}' version {version} not found")
             
-            await self.session.commit()
             logger.info("Template version activated", 
                        identifier=identifier,
                        activated_version=version,
@@ -214,9 +285,10 @@ class EmailTemplateService:
             
             return activated_template, previous_version
             
-        except Exception as e:
-            await self.session.rollback()
-            logger.error("Error activating template version", error=str(e))
+        except Exception:
+            logger.error("Error activating template version", 
+                        identifier=identifier,
+                        exc_info=True)
             raise
 
     async def delete_template(self, identifier: str) -> Tuple[bool, int]:
@@ -230,27 +302,21 @@ class EmailTemplateService:
             Tuple[bool, int]: Success status and number of versions deleted
         """
         try:
-            # Get all versions to count them
-            versions = await self.template_repo.get_versions_by_identifier(identifier)
-            versions_count = len(versions)
-            
-            if versions_count == 0:
-                return False, 0
-            
-            # Delete all versions
-            success = await self.template_repo.delete_template_by_identifier(identifier)
+            # Delete all versions; the count comes back from RETURNING
+            versions_count = await self.template_repo.delete_template_by_identifier(identifier)
+            success = versions_count > 0
             
             if success:
-                await self.session.commit()
                 logger.info("Template deleted successfully", 
                            identifier=identifier,
                            versions_deleted=versions_count)
             
             return success, versions_count
             
-        except Exception as e:
-            await self.session.rollback()
-            logger.error("Error deleting template", error=str(e))
+        except Exception:
+            logger.error("Error deleting template", 
+                        identifier=identifier,
+                        exc_info=True)
             raise
 
     async def template_exists(self, identifier: str) -> bool:
@@ -274,41 +340,19 @@ class EmailTemplateService:
         Raises:
             ValueError: If data is invalid
         """
-        # Create a copy for validation
-        validated_data = EmailTemplateData(
-            subject=data.subject.strip(),
-            body=data.body.strip()
-        )
+        # The input is already a validated model, so check the stripped fields directly
+        subject = data.subject.strip()
+        body = data.body.strip()
         
         # Additional validation
-        if len(validated_data.subject) > 500:
+        if len(subject) > 500:
             raise ValueError("Subject line too long (maximum 500 characters)")
         
-        if len(validated_data.body) > 50000:  # 50KB limit
+        if len(body) > 50000:  # 50KB limit
             raise ValueError("Email body too long (maximum 50,000 characters)")
         
         # Basic HTML sanitization (remove script tags and dangerous attributes)
-        validated_data.body = self._sanitize_html(validated_data.body)
-        
-        return validated_data
-
-    def _sanitize_html(self, html_content: str) -> str:
-        """
-        Basic HTML sanitization to remove dangerous elements.
-        
-        Args:
-            html_content: HTML content to sanitize
-            
-        Returns:
-            str: Sanitized HTML content
-        """
-        # Remove script tags and their content
-        html_content = re.sub(r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>', '', html_content, flags=re.IGNORECASE)
-        
-        # Remove dangerous attributes (onclick, onload, etc.)
-        html_content = re.sub(r'\s*on\w+\s*=\s*["\'][^"\']*["\']', '', html_content, flags=re.IGNORECASE)
-        
-        # Remove javascript: protocol
-        html_content = re.sub(r'javascript:', '', html_content, flags=re.IGNORECASE)
+        body = _sanitize_html(body)
         
-        return html_content
\ No newline at end of file
+        # Build the result once without re-running the field validators
+        return EmailTemplateData.model_construct(subject=subject, body=body)
@@ -1,9 +1,13 @@
 import time
+import random
 import asyncio
-from typing import List, Dict, Any, Tuple, Optional
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Dict, Any, Tuple, Optional, Union
 from decimal import Decimal
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 from sqlmodel.ext.asyncio.session import AsyncSession
+import aiosmtplib
 import structlog
 
 from app.services.email_template_service import EmailTemplateService
@@ -12,6 +16,8 @@ from app.external.email_client import email_client
 from app.schemas.escalation import (
     EscalationRequest,
     EscalationResult,
+    EscalationResultPending,
+    EscalationResultSent,
     EscalationBatchResponse,
     EscalationStats,
     EscalationDegreeInfo,
@@ -19,13 +25,94 @@ from app.schemas.escalation import (
     EscalationValidationError,
     EmailSendingSummary,
     EmailSendingDetail,
+    EmailSendingDetailSent,
+    EmailSendingDetailFailed,
     InvoiceDetail,
     AgingSummary
 )
 from app.schemas.csv_import import ContactReadyClient, AgingSnapshotSummary
+from app.utils import EMAIL_RE
 
 logger = structlog.get_logger()
 
+# Template identifier per escalation degree
+ESCALATION_TEMPLATE_BY_DEGREE = {
+    1: "ESCALATION_LEVEL_1",
+    2: "ESCALATION_LEVEL_2",
+    3: "ESCALATION_LEVEL_3",
+}
+
+# Explanation recorded with each escalation degree
+ESCALATION_REASON_BY_DEGREE = {
+    0: "No escalation needed (all invoices 0-30 days)",
+    1: "Invoices in 31-60 days aging bucket",
+    2: "Invoices in 61-90 days aging bucket",
+    3: "Invoices in 91-120+ days aging buckets",
+}
+
+# Identifier prefix shared by all escalation templates
+ESCALATION_TEMPLATE_PREFIX = "ESCALATION_LEVEL_"
+
+# Upper bound on escalation emails handed to the SMTP server per second
+EMAIL_SENDS_PER_SECOND = 20
+
+# Backoff bounds between retries of a transient email sending failure
+EMAIL_RETRY_BASE_DELAY_SECONDS = 0.5
+EMAIL_RETRY_MAX_DELAY_SECONDS = 8.0
+
+
+@dataclass(slots=True)
+class _AccountBundle:
+    """Per-account data kept from analysis for building email sending details."""
+    
+    account_id: str
+    invoice_details: List[InvoiceDetail]
+    aging_summary: AgingSummary
+    total_outstanding: Decimal
+
+
+def _is_transient_send_error(error: Exception) -> bool:
+    """
+    Decide whether an email sending failure is worth retrying.
+    
+    The SMTP client wraps failures, so the original cause is inspected when
+    present. Connection problems, timeouts and 4xx SMTP replies are
+    transient; 5xx replies (bad recipient, rejected credentials) and other
+    errors are permanent.
+    
+    Args:
+        error: Exception raised while sending
+        
+    Returns:
+        bool: True if the send should be retried
+    """
+    cause = error.__cause__ or error
+    if isinstance(cause, aiosmtplib.SMTPResponseException):
+        return 400 <= cause.code < 500
+    return isinstance(cause, (ConnectionError, TimeoutError, asyncio.TimeoutError))
+
+
+class SendRateLimiter:
+    """
+    Pace async operations to a fixed rate by handing out evenly spaced slots.
+    
+    Each acquire reserves the next free slot and sleeps until it arrives, so
+    bursts are smoothed to at most `rate` acquisitions per second. Slot
+    bookkeeping happens without awaiting, so no lock is needed on one loop.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the next send slot is available."""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class EscalationService:
     """Service for handling invoice escalation processing with AI-powered email generation."""
@@ -80,39 +167,16 @@ class EscalationService:
                     errors=["No valid contacts found for escalation processing"]
                 )
             
-            # Step 2: Calculate escalation degrees and prepare data with invoice details
-            contact_data_with_degrees = []
-            invoice_details_map = {}  # Store invoice details by account name
-            
-            for contact in valid_contacts:
-                degree_info = self._calculate_escalation_degree(contact.invoice_aging_snapshots)
-                if degree_info.degree > 0:  # Only process contacts that need escalation
-                    # Extract invoice details for statistics
-                    invoice_details = self._extract_invoice_details(
-                        contact.invoice_aging_snapshots,
-                        degree_info.qualifying_invoices
-                    )
-                    aging_summary = self._calculate_aging_summary(
-                        contact.invoice_aging_snapshots
-                    )
-                    
-                    contact_dict = contact.dict()
-                    contact_dict['escalation_degree'] = degree_info.degree
-                    contact_dict['degree_info'] = degree_info.dict()
-                    contact_dict['invoice_details'] = [d.dict() for d in invoice_details]
-                    contact_dict['aging_summary'] = aging_summary.dict()
-                    
-                    contact_data_with_degrees.append(contact_dict)
-                    
-                    # Store for later use in email sending
-                    invoice_details_map[contact.account_name] = {
-                        'account_id': contact.client_id,  # Use client_id as account_id
-                        'invoice_details': invoice_details,
-                        'aging_summary': aging_summary,
-                        'total_outstanding': contact.total_outstanding_across_invoices
-                    }
-                else:
-                    skipped_reasons["degree_0_no_escalation"] = skipped_reasons.get("degree_0_no_escalation", 0) + 1
+            # Step 2: Calculate escalation degrees and prepare data with invoice details.
+            # The analysis is CPU-only, so it runs off the event loop.
+            (
+                contact_data_with_degrees,
+                escalation_contacts,
+                invoice_details_map,
+                degree_0_count
+            ) = await asyncio.to_thread(self._analyze_all, valid_contacts)
+            if degree_0_count:
+                skipped_reasons["degree_0_no_escalation"] += degree_0_count
             
             if not contact_data_with_degrees:
                 return EscalationBatchResponse(
@@ -151,29 +215,30 @@ class EscalationService:
             escalation_results = []
             email_sending_details = []
             
+            # Index by account name once; the first contact for a name wins, as with a linear scan
+            escalation_contacts_by_account = {}
+            for escalation_contact in escalation_contacts:
+                escalation_contacts_by_account.setdefault(
+                    escalation_contact[0].account_name, escalation_contact
+                )
+            
             for ai_email in ai_generated_emails:
                 # Find the original contact data to get additional info
-                original_contact = next(
-                    (c for c in contact_data_with_degrees if c['account_name'] == ai_email['account']),
-                    None
-                )
+                original_contact = escalation_contacts_by_account.get(ai_email['account'])
                 
                 if original_contact:
-                    degree_info = original_contact['degree_info']
-                    invoice_details = original_contact['invoice_details']
-                    invoice_details_obj = [InvoiceDetail(**detail) for detail in invoice_details]
-                    aging_summary = AgingSummary(**original_contact['aging_summary'])
+                    _, degree_info, invoice_details, aging_summary = original_contact
                     
-                    escalation_result = EscalationResult(
+                    escalation_result = EscalationResultPending.from_trusted(
                         account=ai_email['account'],
                         email_address=ai_email['email_address'],
                         email_subject=ai_email['email_subject'],
                         email_body=ai_email['email_body'],
-                        escalation_degree=original_contact['escalation_degree'],
-                        template_used=f"ESCALATION_LEVEL_{original_contact['escalation_degree']}",
-                        invoice_count=len(degree_info['qualifying_invoices']),
-                        total_outstanding=Decimal(str(degree_info['total_amount'])),
-                        invoice_details=invoice_details_obj,
+                        escalation_degree=degree_info.degree,
+                        template_used=ESCALATION_TEMPLATE_BY_DEGREE[degree_info.degree],
+                        invoice_count=len(degree_info.qualifying_invoices),
+                        total_outstanding=degree_info.total_amount,
+                        invoice_details=invoice_details,
                         aging_summary=aging_summary
                     )
                     escalation_results.append(escalation_result)
@@ -223,52 +288,134 @@ class EscalationService:
                 errors=[f"Processing failed: {str(e)}"]
             )
 
-    def _calculate_escalation_degree(self, aging_snapshots: List[AgingSnapshotSummary]) -> EscalationDegreeInfo:
+    def _analyze_all(
+        self, 
+        valid_contacts: List[ContactReadyClient]
+    ) -> Tuple[
+        List[Dict[str, Any]],
+        List[Tuple[ContactReadyClient, EscalationDegreeInfo, List[InvoiceDetail], AgingSummary]],
+        Dict[str, _AccountBundle],
+        int
+    ]:
         """
-        Calculate the escalation degree for a set of invoice aging snapshots.
+        Analyze every valid contact and prepare the AI prompt data.
+        
+        Synchronous and free of I/O so it can run in a worker thread.
+        
+        Args:
+            valid_contacts: Contacts that passed filtering
+            
+        Returns:
+            Tuple of (prompt dicts, (contact, degree_info, invoice_details,
+            aging_summary) tuples, invoice details by account name, number
+            of degree 0 contacts)
+        """
+        contact_data_with_degrees = []  # Plain dicts for the AI prompt
+        escalation_contacts = []  # (contact, degree_info, invoice_details, aging_summary)
+        invoice_details_map = {}  # Store invoice details by account name
+        degree_0_count = 0
+        
+        for contact in valid_contacts:
+            # Degree, invoice details and aging totals come from one pass over the snapshots
+            degree_info, invoice_details, aging_summary = self._analyze_contact(
+                contact.invoice_aging_snapshots
+            )
+            if degree_info.degree > 0:  # Only process contacts that need escalation
+                # The prompt needs plain data; the models are kept for building results
+                contact_dict = contact.model_dump()
+                contact_dict['escalation_degree'] = degree_info.degree
+                contact_dict['degree_info'] = degree_info.model_dump()
+                contact_dict['invoice_details'] = [d.model_dump() for d in invoice_details]
+                contact_dict['aging_summary'] = aging_summary.model_dump()
+                
+                contact_data_with_degrees.append(contact_dict)
+                escalation_contacts.append((contact, degree_info, invoice_details, aging_summary))
+                
+                # Store for later use in email sending
+                invoice_details_map[contact.account_name] = _AccountBundle(
+                    account_id=contact.client_id,  # Use client_id as account_id
+                    invoice_details=invoice_details,
+                    aging_summary=aging_summary,
+                    total_outstanding=contact.total_outstanding_across_invoices
+                )
+            else:
+                degree_0_count += 1
+        
+        return contact_data_with_degrees, escalation_contacts, invoice_details_map, degree_0_count
+
+    def _analyze_contact(
+        self, 
+        aging_snapshots: List[AgingSnapshotSummary]
+    ) -> Tuple[EscalationDegreeInfo, List[InvoiceDetail], AgingSummary]:
+        """
+        Calculate escalation degree, invoice details and aging totals in one pass.
+        
+        Invoices of degree 0 are ignored for the degree total and details but
+        still count towards the aging summary.
         
         Args:
             aging_snapshots: List of aging snapshots for an account
             
         Returns:
-            EscalationDegreeInfo: Calculated degree and supporting information
+            Tuple of (EscalationDegreeInfo, qualifying InvoiceDetails, AgingSummary)
         """
         max_degree = 0
         qualifying_invoices = []
+        invoice_details = []
         total_amount = Decimal('0')
-        reason = "No escalation needed (all invoices 0-30 days)"
+        days_0_30 = days_31_60 = days_61_90 = days_91_120 = days_over_120 = Decimal('0')
         
         for snapshot in aging_snapshots:
+            # Read each bucket once; they feed both the totals and the invoice total
+            d0 = snapshot.days_0_30
+            d31 = snapshot.days_31_60
+            d61 = snapshot.days_61_90
+            d91 = snapshot.days_91_120
+            d120 = snapshot.days_over_120
+            days_0_30 += d0
+            days_31_60 += d31
+            days_61_90 += d61
+            days_91_120 += d91
+            days_over_120 += d120
+            
             invoice_degree = self._get_invoice_degree(snapshot)
+            if invoice_degree == 0:  # Ignore degree 0 invoices
+                continue
             
             if invoice_degree > max_degree:
                 max_degree = invoice_degree
-                
-            if invoice_degree > 0:  # Ignore degree 0 invoices
-                qualifying_invoices.append(snapshot.invoice_number)
-                
-                # Calculate total outstanding for this invoice
-                invoice_total = (
-                    snapshot.days_0_30 + snapshot.days_31_60 + 
-                    snapshot.days_61_90 + snapshot.days_91_120 + 
-                    snapshot.days_over_120
-                )
-                total_amount += invoice_total
-        
-        # Update reason based on final degree
-        if max_degree == 1:
-            reason = "Invoices in 31-60 days aging bucket"
-        elif max_degree == 2:
-            reason = "Invoices in 61-90 days aging bucket"
-        elif max_degree == 3:
-            reason = "Invoices in 91-120+ days aging buckets"
-        
-        return EscalationDegreeInfo(
+            
+            # Calculate total outstanding for this invoice
+            invoice_total = d0 + d31 + d61 + d91 + d120
+            total_amount += invoice_total
+            qualifying_invoices.append(snapshot.invoice_number)
+            
+            # Calculate actual days overdue from invoice date
+            days_overdue = self._calculate_actual_days_overdue(snapshot.invoice_date, snapshot.snapshot_date)
+            invoice_details.append(InvoiceDetail.from_trusted(
+                invoice_id=snapshot.invoice_number,  # Using invoice number as ID
+                invoice_number=snapshot.invoice_number,
+                invoice_amount=invoice_total,  # Using total as we don't have original amount
+                total_outstanding=invoice_total,
+                days_overdue=days_overdue,
+                aging_bucket=self._get_aging_bucket_from_days(days_overdue)
+            ))
+        
+        degree_info = EscalationDegreeInfo(
             degree=max_degree,
-            reason=reason,
+            reason=ESCALATION_REASON_BY_DEGREE[max_degree],
             qualifying_invoices=qualifying_invoices,
             total_amount=total_amount
         )
+        aging_summary = AgingSummary.from_trusted(
+            days_0_30=days_0_30,
+            days_31_60=days_31_60,
+            days_61_90=days_61_90,
+            days_91_120=days_91_120,
+            days_over_120=days_over_120,
+            total=days_0_30 + days_31_60 + days_61_90 + days_91_120 + days_over_120
+        )
+        return degree_info, invoice_details, aging_summary
 
     def _get_invoice_degree(self, snapshot: AgingSnapshotSummary) -> int:
         """
@@ -295,10 +442,30 @@ class EscalationService:
         # Default to degree 0 (0-30 days)
         return 0
 
+    def _max_degree_only(self, aging_snapshots: List[AgingSnapshotSummary]) -> int:
+        """
+        Get the highest escalation degree across snapshots, stopping at degree 3.
+        
+        Args:
+            aging_snapshots: List of aging snapshots for an account
+            
+        Returns:
+            int: Highest escalation degree (0-3)
+        """
+        max_degree = 0
+        for snapshot in aging_snapshots:
+            invoice_degree = self._get_invoice_degree(snapshot)
+            if invoice_degree == 3:
+                # No invoice can raise the degree further
+                return 3
+            if invoice_degree > max_degree:
+                max_degree = invoice_degree
+        return max_degree
+
     async def _filter_contacts(
         self, 
         contacts: List[ContactReadyClient]
-    ) -> Tuple[List[ContactReadyClient], Dict[str, int]]:
+    ) -> Tuple[List[ContactReadyClient], Counter[str]]:
         """
         Filter contacts to identify those eligible for escalation processing.
         
@@ -309,22 +476,22 @@ class EscalationService:
             Tuple of (valid_contacts, skip_reasons_count)
         """
         valid_contacts = []
-        skip_reasons = {}
+        skip_reasons: Counter[str] = Counter()
         
         for contact in contacts:
             # Skip DNC contacts
             if contact.dnc_status:
-                skip_reasons["dnc_status"] = skip_reasons.get("dnc_status", 0) + 1
+                skip_reasons["dnc_status"] += 1
                 continue
             
             # Skip contacts without email
             if not contact.email_address or not contact.email_address.strip():
-                skip_reasons["no_email"] = skip_reasons.get("no_email", 0) + 1
+                skip_reasons["no_email"] += 1
                 continue
             
             # Skip contacts without aging snapshots
             if not contact.invoice_aging_snapshots:
-                skip_reasons["no_invoices"] = skip_reasons.get("no_invoices", 0) + 1
+                skip_reasons["no_invoices"] += 1
                 continue
             
             valid_contacts.append(contact)
@@ -344,23 +511,23 @@ class EscalationService:
             List[Dict]: Email templates formatted for AI processing
         """
         try:
-            # Get the latest templates summary
-            templates_summary = await self.template_service.get_latest_templates_summary()
-            
-            # Filter for escalation templates
-            escalation_templates = []
-            for template in templates_summary:
-                if template.identifier.startswith('ESCALATION_LEVEL_'):
-                    escalation_templates.append({
-                        "identifier": template.identifier,
-                        "template_data": {
-                            "subject": template.template_data.subject,
-                            "body": template.template_data.body
-                        }
-                    })
+            # The identifier prefix is filtered in SQL
+            templates_summary = await self.template_service.get_latest_templates_summary(
+                ESCALATION_TEMPLATE_PREFIX
+            )
+            
+            escalation_templates = [
+                {
+                    "identifier": template.identifier,
+                    "template_data": {
+                        "subject": template.template_data.subject,
+                        "body": template.template_data.body
+                    }
+                }
+                for template in templates_summary
+            ]
             
             logger.info("Retrieved escalation templates", 
-                       total_templates=len(templates_summary),
                        escalation_templates=len(escalation_templates))
             
             return escalation_templates
@@ -372,23 +539,33 @@ class EscalationService:
     async def analyze_escalation_needs(
         self, 
         contacts: List[ContactReadyClient]
-    ) -> EscalationStats:
+    ) -> Tuple[EscalationStats, Dict[int, List[str]]]:
         """
         Analyze escalation needs without generating emails.
         
+        Each contact's escalation degree is computed once and feeds both the
+        statistics and the per-degree breakdown of account names.
+        
         Args:
             contacts: List of contact ready clients
             
         Returns:
-            EscalationStats: Statistics about escalation requirements
+            Tuple of (EscalationStats, account names by escalation degree)
         """
         total_accounts = len(contacts)
-        degree_counts = {0: 0, 1: 0, 2: 0, 3: 0}
+        degree_counts = [0, 0, 0, 0]
+        degree_breakdown: Dict[int, List[str]] = {}
         dnc_count = 0
         no_email_count = 0
         total_outstanding = Decimal('0')
         
         for contact in contacts:
+            # Breakdown covers every contact with snapshots, including skipped ones
+            degree = 0
+            if contact.invoice_aging_snapshots:
+                degree = self._max_degree_only(contact.invoice_aging_snapshots)
+                degree_breakdown.setdefault(degree, []).append(contact.account_name)
+            
             # Count DNC and no email
             if contact.dnc_status:
                 dnc_count += 1
@@ -398,17 +575,14 @@ class EscalationService:
                 no_email_count += 1
                 continue
             
-            # Calculate degree for this contact
+            # No invoices = degree 0
+            degree_counts[degree] += 1
             if contact.invoice_aging_snapshots:
-                degree_info = self._calculate_escalation_degree(contact.invoice_aging_snapshots)
-                degree_counts[degree_info.degree] += 1
                 total_outstanding += contact.total_outstanding_across_invoices
-            else:
-                degree_counts[0] += 1  # No invoices = degree 0
         
         processable_count = degree_counts[1] + degree_counts[2] + degree_counts[3]
         
-        return EscalationStats(
+        stats = EscalationStats(
             total_accounts=total_accounts,
             degree_0_count=degree_counts[0],
             degree_1_count=degree_counts[1],
@@ -419,6 +593,7 @@ class EscalationService:
             processable_count=processable_count,
             total_outstanding=total_outstanding
         )
+        return stats, degree_breakdown
 
     async def validate_escalation_input(
         self, 
@@ -438,6 +613,7 @@ class EscalationService:
         
         for contact in contacts:
             account_name = contact.account_name or "Unknown Account"
+            errors_before = len(validation_errors)
             
             # Validate account name
             if not contact.account_name or not contact.account_name.strip():
@@ -449,7 +625,7 @@ class EscalationService:
             
             # Validate email format if provided
             if contact.email_address:
-                if "@" not in contact.email_address or "." not in contact.email_address:
+                if not EMAIL_RE.fullmatch(contact.email_address):
                     validation_errors.append(EscalationValidationError(
                         account_name=account_name,
                         field="email_address",
@@ -473,9 +649,8 @@ class EscalationService:
                             error_message="Invoice number is required"
                         ))
             
-            # Count as valid if no errors for this account
-            account_errors = [e for e in validation_errors if e.account_name == account_name]
-            if not account_errors:
+            # Count as valid if this contact added no errors
+            if len(validation_errors) == errors_before:
                 valid_accounts += 1
         
         return EscalationValidationResponse(
@@ -485,84 +660,10 @@ class EscalationService:
             invalid_accounts=len(contacts) - valid_accounts
         )
 
-    def _extract_invoice_details(
-        self, 
-        aging_snapshots: List[AgingSnapshotSummary],
-        qualifying_invoices: List[str]
-    ) -> List[InvoiceDetail]:
-        """
-        Extract detailed invoice information for qualifying invoices.
-        
-        Args:
-            aging_snapshots: All aging snapshots for the account
-            qualifying_invoices: List of invoice numbers that qualify for escalation
-            
-        Returns:
-            List[InvoiceDetail]: Detailed information for each qualifying invoice
-        """
-        invoice_details = []
-        
-        for snapshot in aging_snapshots:
-            # Only include invoices that qualify for escalation
-            if snapshot.invoice_number in qualifying_invoices:
-                # Calculate total outstanding for this invoice
-                total_outstanding = (
-                    snapshot.days_0_30 + snapshot.days_31_60 + 
-                    snapshot.days_61_90 + snapshot.days_91_120 + 
-                    snapshot.days_over_120
-                )
-                
-                # Calculate actual days overdue from invoice date
-                days_overdue = self._calculate_actual_days_overdue(snapshot.invoice_date, snapshot.snapshot_date)
-                aging_bucket = self._get_aging_bucket_from_days(days_overdue)
-                
-                invoice_detail = InvoiceDetail(
-                    invoice_id=snapshot.invoice_number,  # Using invoice number as ID
-                    invoice_number=snapshot.invoice_number,
-                    invoice_amount=total_outstanding,  # Using total as we don't have original amount
-                    total_outstanding=total_outstanding,
-                    days_overdue=days_overdue,
-                    aging_bucket=aging_bucket
-                )
-                invoice_details.append(invoice_detail)
-        
-        return invoice_details
-
-    def _calculate_aging_summary(
-        self, 
-        aging_snapshots: List[AgingSnapshotSummary]
-    ) -> AgingSummary:
-        """
-        Calculate the total aging summary across all invoices.
-        
-        Args:
-            aging_snapshots: All aging snapshots for the account
-            
-        Returns:
-            AgingSummary: Totals for each aging bucket
-        """
-        summary = AgingSummary()
-        
-        for snapshot in aging_snapshots:
-            summary.days_0_30 += snapshot.days_0_30
-            summary.days_31_60 += snapshot.days_31_60
-            summary.days_61_90 += snapshot.days_61_90
-            summary.days_91_120 += snapshot.days_91_120
-            summary.days_over_120 += snapshot.days_over_120
-        
-        # Calculate total
-        summary.total = (
-            summary.days_0_30 + summary.days_31_60 + 
-            summary.days_61_90 + summary.days_91_120 + 
-            summary.days_over_120
-        )
-        
-        return summary
-
     async def _send_escalation_emails(
         self, 
         escalation_results: List[EscalationResult],
-        invoice_details_map: Dict[str, Any],
+        invoice_details_map: Dict[str, _AccountBundle],
         request: EscalationRequest
     ) -> Tuple[EmailSendingSummary, List[EmailSendingDetail]]:
         """
@@ -581,94 +682,104 @@ class EscalationService:
         successful_sends = 0
         failed_sends = 0
         retry_attempts = 0
-        email_sending_details = []
+        # One detail per result, stored at the result's index as outcomes arrive
+        email_sending_details: List[EmailSendingDetail] = [None] * total_attempts
         
         logger.info("Starting email sending process", 
                    total_emails=total_attempts,
                    batch_size=request.email_batch_size)
         
-        # Process emails in batches to avoid overwhelming SMTP server
-        batch_size = min(request.email_batch_size, 10)  # Cap at 10 for safety
-        
-        for i in range(0, len(escalation_results), batch_size):
-            batch_results = escalation_results[i:i + batch_size]
-            
-            # Send batch concurrently
-            batch_tasks = []
-            for result in batch_results:
-                task = self._send_single_email(result, request.retry_failed_emails)
-                batch_tasks.append(task)
-            
-            # Wait for batch completion
-            batch_responses = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            # Process batch results
-            for j, response in enumerate(batch_responses):
-                result = batch_results[j]
-                account_details = invoice_details_map.get(result.account, {})
-                
-                if isinstance(response, Exception):
-                    # Email sending failed
-                    failed_sends += 1
-                    error_message = str(response)
-                    
-                    # Create email sending detail with error
-                    email_detail = EmailSendingDetail(
-                        account_id=account_details.get('account_id', result.account),
-                        account_name=result.account,
-                        email_address=result.email_address,
-                        email_sent=False,
-                        email_sent_at=None,
-                        email_message_id=None,
-                        email_subject=result.email_subject,
-                        email_send_error=error_message,
-                        escalation_degree=result.escalation_degree,
-                        template_used=result.template_used,
-                        invoice_count=result.invoice_count,
-                        total_outstanding=result.total_outstanding,
-                        oldest_invoice_days=self._get_oldest_invoice_days(result.invoice_details),
-                        invoices=result.invoice_details,
-                        aging_summary=result.aging_summary
-                    )
-                    email_sending_details.append(email_detail)
-                    
-                    # Update escalation result
-                    result.email_sent = False
-                    result.email_send_error = error_message
-                    
-                else:
-                    # Email sending succeeded
-                    successful_sends += 1
-                    
-                    # Create email sending detail with success
-                    email_detail = EmailSendingDetail(
-                        account_id=account_details.get('account_id', result.account),
-                        account_name=result.account,
-                        email_address=result.email_address,
-                        email_sent=True,
-                        email_sent_at=response.get('sent_at'),
-                        email_message_id=response.get('message_id'),
-                        email_subject=result.email_subject,
-                        email_send_error=None,
-                        escalation_degree=result.escalation_degree,
-                        template_used=result.template_used,
-                        invoice_count=result.invoice_count,
-                        total_outstanding=result.total_outstanding,
-                        oldest_invoice_days=self._get_oldest_invoice_days(result.invoice_details),
-                        invoices=result.invoice_details,
-                        aging_summary=result.aging_summary
+        # Bound in-flight sends and pace them so the SMTP server isn't overwhelmed
+        max_concurrency = min(request.email_batch_size, 10)  # Cap at 10 for safety
+        semaphore = asyncio.Semaphore(max_concurrency)
+        rate_limiter = SendRateLimiter(EMAIL_SENDS_PER_SECOND)
+        
+        async def send_with_limits(
+            index: int, 
+            result: EscalationResult
+        ) -> Tuple[int, Union[Dict[str, Any], Exception]]:
+            async with semaphore:
+                try:
+                    response = await self._send_single_email(
+                        result, request.retry_failed_emails, rate_limiter
                     )
-                    email_sending_details.append(email_detail)
-                    
-                    # Update escalation result
-                    result.email_sent = True
-                    result.email_sent_at = datetime.fromisoformat(response['sent_at'].replace('Z', '+00:00'))
-                    result.email_message_id = response.get('message_id')
-            
-            # Brief pause between batches
-            if i + batch_size < len(escalation_results):
-                await asyncio.sleep(0.5)
-        
+                except Exception as e:
+                    response = e
+            return index, response
+        
+        # Dispatch every email at once; the semaphore and limiter smooth the bursts
+        send_tasks = [
+            asyncio.create_task(send_with_limits(i, result))
+            for i, result in enumerate(escalation_results)
+        ]
+        
+        # Record each outcome as soon as it arrives instead of waiting on the slowest send
+        for completed in asyncio.as_completed(send_tasks):
+            i, response = await completed
+            result = escalation_results[i]
+            bundle = invoice_details_map.get(result.account)
+            account_id = bundle.account_id if bundle is not None else result.account
+            oldest_invoice_days = self._get_oldest_invoice_days(result.invoice_details)
+            
+            if isinstance(response, Exception):
+                # Email sending failed
+                failed_sends += 1
+                error_message = str(response)
+                
+                # Create email sending detail with error
+                email_detail = EmailSendingDetailFailed.from_trusted(
+                    account_id=account_id,
+                    account_name=result.account,
+                    email_address=result.email_address,
+                    email_subject=result.email_subject,
+                    email_send_error=error_message,
+                    escalation_degree=result.escalation_degree,
+                    template_used=result.template_used,
+                    invoice_count=result.invoice_count,
+                    total_outstanding=result.total_outstanding,
+                    oldest_invoice_days=oldest_invoice_days,
+                    invoices=result.invoice_details,
+                    aging_summary=result.aging_summary
+                )
+                email_sending_details[i] = email_detail
+                
+                # Record the failure on the escalation result
+                escalation_results[i] = result.model_copy(
+                    update={'email_send_error': error_message}
+                )
+                
+            else:
+                # Email sending succeeded
+                successful_sends += 1
+                sent_at = response['sent_at']
+                
+                # Create email sending detail with success
+                email_detail = EmailSendingDetailSent.from_trusted(
+                    account_id=account_id,
+                    account_name=result.account,
+                    email_address=result.email_address,
+                    email_sent_at=sent_at,
+                    email_message_id=response.get('message_id'),
+                    email_subject=result.email_subject,
+                    escalation_degree=result.escalation_degree,
+                    template_used=result.template_used,
+                    invoice_count=result.invoice_count,
+                    total_outstanding=result.total_outstanding,
+                    oldest_invoice_days=oldest_invoice_days,
+                    invoices=result.invoice_details,
+                    aging_summary=result.aging_summary
+                )
+                email_sending_details[i] = email_detail
+                
+                # Replace the pending result with its sent form
+                result_fields = dict(result)
+                del result_fields['email_sent'], result_fields['email_send_error']
+                escalation_results[i] = EscalationResultSent.from_trusted(
+                    **result_fields,
+                    email_sent_at=sent_at,
+                    email_message_id=response.get('message_id')
+                )
+    
         # Calculate final statistics
         send_duration = time.time() - start_time
         
@@ -691,7 +802,8 @@ class EscalationService:
     async def _send_single_email(
         self, 
         escalation_result: EscalationResult,
-        retry_on_failure: bool = True
+        retry_on_failure: bool = True,
+        rate_limiter: Optional[SendRateLimiter] = None
     ) -> Dict[str, Any]:
         """
         Send a single escalation email with retry logic.
@@ -699,6 +811,7 @@ class EscalationService:
         Args:
             escalation_result: The escalation result containing email details
             retry_on_failure: Whether to retry failed sends
+            rate_limiter: Limiter acquired before every send attempt, if any
             
         Returns:
             Dict: Email sending result from SMTP client
@@ -710,6 +823,8 @@ class EscalationService:
         
         for attempt in range(max_retries):
             try:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
                 result = await email_client.send_email(
                     to_email=escalation_result.email_address,
                     subject=escalation_result.email_subject,
@@ -732,12 +847,13 @@ class EscalationService:
                              max_retries=max_retries,
                              error=str(e))
                 
-                if attempt == max_retries - 1:
-                    # Final attempt failed
+                if attempt == max_retries - 1 or not _is_transient_send_error(e):
+                    # Final attempt failed, or retrying cannot help
                     raise e
                 
-                # Wait before retry
-                await asyncio.sleep(1.0 * (attempt + 1))
+                # Exponential backoff with jitter so retries don't arrive in lockstep
+                delay = min(EMAIL_RETRY_MAX_DELAY_SECONDS, EMAIL_RETRY_BASE_DELAY_SECONDS * 2 ** attempt)
+                await asyncio.sleep(random.uniform(delay / 2, delay))
         
         # Should never reach here, but just in case
         raise Exception("Email sending failed after all retries")
@@ -768,8 +884,8 @@ class EscalationService:
         Returns:
             int: Number of days since invoice date (0 if snapshot is before invoice)
         """
-        # Calculate days since invoice was issued (simple date difference)
-        days_overdue = (snapshot_date - invoice_date).days
+        # Calculate days since invoice was issued; ordinal subtraction skips the timedelta
+        days_overdue = snapshot_date.toordinal() - invoice_date.toordinal()
         
         # Return 0 if snapshot is before invoice date
         return max(0, days_overdue)
@@ -1,7 +1,14 @@
 import hashlib
-import random
+import re
+import secrets
 import string
 
+# Character set for generated passwords: letters (uppercase + lowercase) and digits
+PASSWORD_CHARACTERS = string.ascii_letters + string.digits
+
+# Cheap syntactic email check shared by the CSV import and escalation validation
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
 
 def generate_password_with_md5():
     """
@@ -11,14 +18,12 @@ def generate_password_with_md5():
     Returns:
         tuple: (password, md5_hash) - the original password and its MD5 hash
     """
-    # Define character set: letters (uppercase + lowercase) and digits
-    characters = string.ascii_letters + string.digits
-
-    # Generate random 8-character password
-    password = "".join(random.choice(characters) for _ in range(8))
+    # Generate random 8-character password from the OS CSPRNG
+    password = "".join(secrets.choice(PASSWORD_CHARACTERS) for _ in range(8))
 
-    # Convert password to MD5 hash
-    md5_hash = hashlib.md5(password.encode("utf-8")).hexdigest()
+    # MD5 digest for consumers that expect it; not a password-storage hash,
+    # so let hashlib use its non-FIPS fast path
+    md5_hash = hashlib.md5(password.encode("utf-8"), usedforsecurity=False).hexdigest()
 
     return password, md5_hash
 
@@ -33,8 +38,7 @@ def generate_random_password(length=12):
     Returns:
         str: Randomly generated password.
     """
-    characters = string.ascii_letters + string.digits
-    return "".join(random.choice(characters) for _ in range(length))
+    return "".join(secrets.choice(PASSWORD_CHARACTERS) for _ in range(length))
 
 def split_name(name: str):
     """
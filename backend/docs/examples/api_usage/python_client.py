@@ -16,8 +16,9 @@ Requirements:
 import asyncio
 import json
 import logging
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from decimal import Decimal
 
@@ -75,9 +76,19 @@ class FinemanWestClient:
         self.base_url = base_url.rstrip("/")
         self.api_base = f"{self.base_url}/api/v1"
         self.client = None
+        # Responses of quasi-static endpoints: endpoint -> (expires_at, data)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
         
     async def __aenter__(self):
-        self.client = httpx.AsyncClient(timeout=60.0)
+        # One pooled client for every call; keep connections warm between requests
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            )
+        )
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -103,6 +114,32 @@ class FinemanWestClient:
             logger.error(f"Request failed: {e}")
             raise
     
+    async def _cached_get(self, endpoint: str, ttl: float = 60.0) -> Dict[str, Any]:
+        """GET an endpoint whose response rarely changes, reusing it for ttl seconds"""
+        cached = self._cache.get(endpoint)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        data = await self._request("GET", endpoint)
+        self._cache[endpoint] = (time.monotonic() + ttl, data)
+        return data
+    
+    @staticmethod
+    def _serialize_clients(contact_ready_clients: List[ContactReadyClient]) -> List[Dict[str, Any]]:
+        """Convert contact ready client dataclasses to request payload dicts"""
+        # Shallow field copy; dataclasses.asdict would deep-copy every snapshot list
+        return [
+            {
+                "client_id": client.client_id,
+                "account_name": client.account_name,
+                "email_address": client.email_address,
+                "invoice_aging_snapshots": client.invoice_aging_snapshots,
+                "total_outstanding_across_invoices": client.total_outstanding_across_invoices,
+                "dnc_status": client.dnc_status
+            }
+            for client in contact_ready_clients
+        ]
+    
     # Health and System Methods
     
     async def health_check(self) -> Dict[str, Any]:
@@ -114,7 +151,7 @@ class FinemanWestClient:
     
     async def ai_status(self) -> Dict[str, Any]:
         """Check Claude AI service status"""
-        return await self._request("GET", "/escalation/ai/status")
+        return await self._cached_get("/escalation/ai/status")
     
     # CSV Import Methods
     
@@ -136,18 +173,14 @@ class FinemanWestClient:
             ImportResult with processing statistics and contact ready clients
         """
         if isinstance(csv_file, (str, Path)):
-            with open(csv_file, 'rb') as f:
-                files = {"file": ("data.csv", f, "text/csv")}
-                response = await self.client.post(
-                    f"{self.api_base}/csv-import/upload",
-                    files=files
-                )
-        else:
-            files = {"file": ("data.csv", csv_file, "text/csv")}
-            response = await self.client.post(
-                f"{self.api_base}/csv-import/upload",
-                files=files
-            )
+            # Read off the event loop so other requests keep running meanwhile
+            csv_file = await asyncio.to_thread(Path(csv_file).read_bytes)
+        
+        files = {"file": ("data.csv", csv_file, "text/csv")}
+        response = await self.client.post(
+            f"{self.api_base}/csv-import/upload",
+            files=files
+        )
         
         response.raise_for_status()
         data = response.json()
@@ -194,18 +227,7 @@ class FinemanWestClient:
     
     async def analyze_escalation_needs(self, contact_ready_clients: List[ContactReadyClient]) -> Dict[str, Any]:
         """Analyze escalation requirements without generating emails"""
-        # Convert dataclasses to dicts
-        clients_data = [
-            {
-                "client_id": client.client_id,
-                "account_name": client.account_name,
-                "email_address": client.email_address,
-                "invoice_aging_snapshots": client.invoice_aging_snapshots,
-                "total_outstanding_across_invoices": client.total_outstanding_across_invoices,
-                "dnc_status": client.dnc_status
-            }
-            for client in contact_ready_clients
-        ]
+        clients_data = self._serialize_clients(contact_ready_clients)
         
         payload = {"contact_ready_clients": clients_data}
         return await self._request("POST", "/escalation/analyze", json=payload)
@@ -235,18 +257,7 @@ class FinemanWestClient:
         Returns:
             EscalationResult with processing statistics
         """
-        # Convert dataclasses to dicts
-        clients_data = [
-            {
-                "client_id": client.client_id,
-                "account_name": client.account_name,
-                "email_address": client.email_address,
-                "invoice_aging_snapshots": client.invoice_aging_snapshots,
-                "total_outstanding_across_invoices": client.total_outstanding_across_invoices,
-                "dnc_status": client.dnc_status
-            }
-            for client in contact_ready_clients
-        ]
+        clients_data = self._serialize_clients(contact_ready_clients)
         
         payload = {
             "contact_ready_clients": clients_data,
@@ -269,24 +280,14 @@ class FinemanWestClient:
     
     async def validate_escalation_input(self, contact_ready_clients: List[ContactReadyClient]) -> Dict[str, Any]:
         """Validate contact ready clients data"""
-        clients_data = [
-            {
-                "client_id": client.client_id,
-                "account_name": client.account_name,
-                "email_address": client.email_address,
-                "invoice_aging_snapshots": client.invoice_aging_snapshots,
-                "total_outstanding_across_invoices": client.total_outstanding_across_invoices,
-                "dnc_status": client.dnc_status
-            }
-            for client in contact_ready_clients
-        ]
+        clients_data = self._serialize_clients(contact_ready_clients)
         
         payload = {"contact_ready_clients": clients_data}
         return await self._request("POST", "/escalation/validate", json=payload)
     
     async def get_escalation_degree_info(self) -> Dict[str, Any]:
         """Get escalation degree calculation rules"""
-        return await self._request("GET", "/escalation/degrees/info")
+        return await self._cached_get("/escalation/degrees/info")
 
 
 # Example usage and demonstration
@@ -298,34 +299,39 @@ async def main():
     
     async with FinemanWestClient("http://localhost:8080") as client:
         
+        # Independent read-only calls go out together; results are reported in order below
+        health, ai_status, template_data, degree_info = await asyncio.gather(
+            client.health_check(),
+            client.ai_status(),
+            client.download_csv_template(),
+            client.get_escalation_degree_info(),
+            return_exceptions=True
+        )
+        
         # 1. Health Check
         print("\n1️⃣  Health Check")
-        try:
-            health = await client.health_check()
-            print(f"✅ API Status: {health['status']}")
-            print(f"📊 Database: {health['database']}")
-        except Exception as e:
-            print(f"❌ Health check failed: {e}")
+        if isinstance(health, Exception):
+            print(f"❌ Health check failed: {health}")
             return
+        print(f"✅ API Status: {health['status']}")
+        print(f"📊 Database: {health['database']}")
         
         # 2. AI Service Status
         print("\n2️⃣  AI Service Status")
-        try:
-            ai_status = await client.ai_status()
+        if isinstance(ai_status, Exception):
+            print(f"⚠️  AI status check failed: {ai_status}")
+        else:
             print(f"🤖 Claude AI: {ai_status['status']}")
             print(f"🔮 Model: {ai_status.get('model', 'Unknown')}")
-        except Exception as e:
-            print(f"⚠️  AI status check failed: {e}")
         
         # 3. Download CSV Template
         print("\n3️⃣  CSV Template Download")
-        try:
-            template_data = await client.download_csv_template()
+        if isinstance(template_data, Exception):
+            print(f"❌ Template download failed: {template_data}")
+        else:
             with open("downloaded_template.csv", "wb") as f:
                 f.write(template_data)
             print(f"✅ Template downloaded: {len(template_data)} bytes")
-        except Exception as e:
-            print(f"❌ Template download failed: {e}")
         
         # 4. Create Email Template
         print("\n4️⃣  Email Template Creation")
@@ -391,13 +397,12 @@ async def main():
         
         # 8. Get Escalation Rules
         print("\n8️⃣  Escalation Rules")
-        try:
-            degree_info = await client.get_escalation_degree_info()
+        if isinstance(degree_info, Exception):
+            print(f"❌ Degree info failed: {degree_info}")
+        else:
             print("📈 Escalation degrees:")
             for degree, info in degree_info['degrees'].items():
                 print(f"   Level {degree}: {info['description']}")
-        except Exception as e:
-            print(f"❌ Degree info failed: {e}")
     
     print("\n🎉 Python Client Demo Complete!")
     print("\n📚 Next steps:")
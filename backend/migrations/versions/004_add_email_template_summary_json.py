@@ -0,0 +1,26 @@
+"""Add pre-serialized summary payload to email templates
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-07-25 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add summary payload column
+    op.add_column('email_templates', sa.Column('summary_json', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    # Drop summary payload column
+    op.drop_column('email_templates', 'summary_json')
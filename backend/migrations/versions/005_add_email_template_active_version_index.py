@@ -0,0 +1,39 @@
+"""Add partial index for active email template version lookups
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-07-25 00:00:01.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build the index without blocking template writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_email_templates_identifier_version_active',
+            'email_templates',
+            ['identifier', sa.text('version DESC')],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    # Drop index
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_email_templates_identifier_version_active',
+            table_name='email_templates',
+            postgresql_concurrently=True
+        )
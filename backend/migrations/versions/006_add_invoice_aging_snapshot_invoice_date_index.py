@@ -0,0 +1,38 @@
+"""Add index for per-invoice aging snapshot lookups
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-07-25 00:00:02.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Build the index without blocking snapshot imports
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_invoice_aging_snapshots_invoice_id_snapshot_date',
+            'invoice_aging_snapshots',
+            ['invoice_id', sa.text('snapshot_date DESC')],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    # Drop index
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_invoice_aging_snapshots_invoice_id_snapshot_date',
+            table_name='invoice_aging_snapshots',
+            postgresql_concurrently=True
+        )
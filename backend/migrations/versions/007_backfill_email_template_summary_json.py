@@ -0,0 +1,57 @@
+"""Backfill pre-serialized summary payloads of existing email templates
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-07-25 00:00:03.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.schemas.email_template import parse_template_data
+from app.services.email_template_service import _summary_json
+
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+email_templates = sa.table(
+    'email_templates',
+    sa.column('id', sa.String()),
+    sa.column('identifier', sa.String()),
+    sa.column('data', sa.JSON()),
+    sa.column('summary_json', sa.Text())
+)
+
+
+def upgrade() -> None:
+    # Serialize every version exactly as the summary endpoint does, so stored
+    # payloads match the ones written with new versions byte for byte
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.select(email_templates.c.id, email_templates.c.identifier, email_templates.c.data)
+    ).all()
+    if not rows:
+        return
+    
+    connection.execute(
+        email_templates.update()
+        .where(email_templates.c.id == sa.bindparam('template_id'))
+        .values(summary_json=sa.bindparam('payload')),
+        [
+            {
+                'template_id': template_id,
+                'payload': _summary_json(identifier, parse_template_data(data))
+            }
+            for template_id, identifier, data in rows
+        ]
+    )
+
+
+def downgrade() -> None:
+    # Payloads are regenerated on the next upgrade
+    op.execute("UPDATE email_templates SET summary_json = NULL")
@@ -0,0 +1,78 @@
+import asyncio
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Settings are required at import time; tests never connect through the app's engine
+for _name in ("DB_USER", "DB_PASSWORD", "DB_NAME", "DB_CONNECTION_NAME"):
+    os.environ.setdefault(_name, "test")
+
+import app.models  # noqa: F401 - registers the tables on SQLModel.metadata
+import app.models.email_template  # noqa: F401
+from app.database import _orjson_serializer
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# PostgreSQL database the repository and import tests may recreate freely,
+# e.g. postgresql+asyncpg://postgres@127.0.0.1:5432/app_test
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio, the loop the application uses."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def migrated_database():
+    """Build the schema from the Alembic migrations, as deployed databases are."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    
+    engine = create_engine_for_tests()
+    
+    async def reset_schema():
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP SCHEMA public CASCADE"))
+            await conn.execute(text("CREATE SCHEMA public"))
+        await engine.dispose()
+    
+    asyncio.run(reset_schema())
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    config.set_main_option("sqlalchemy.url", TEST_DATABASE_URL)
+    command.upgrade(config, "head")
+    return TEST_DATABASE_URL
+
+
+def create_engine_for_tests():
+    """Engine configured like the application's, without pooling between test loops."""
+    return create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=NullPool,
+        json_serializer=_orjson_serializer,
+        json_deserializer=orjson.loads
+    )
+
+
+@pytest.fixture
+async def db_session(migrated_database):
+    """Session on the migrated schema, with every table emptied first."""
+    engine = create_engine_for_tests()
+    table_names = ", ".join(table.name for table in SQLModel.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {table_names} CASCADE"))
+    
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
@@ -0,0 +1,210 @@
+from decimal import Decimal
+
+import pytest
+from sqlmodel import func, select
+
+from app.models import Account, Contact, Invoice, InvoiceAgingSnapshot
+from app.services import csv_import_service
+from app.services.csv_import_service import CSVImportService
+
+
+CSV_HEADER = (
+    "Client ID,Client Name,Email Address,Invoice #,Invoice Date,Invoice Amount,"
+    "Current (0-30),31-60 Days,61-90 Days,91-120 Days,120+ Days,Total Outstanding\n"
+)
+
+
+class FailingSession:
+    """Session stand-in whose every statement fails, as if the database went away."""
+
+    def __init__(self):
+        self.rolled_back = False
+
+    async def execute(self, *args, **kwargs):
+        raise RuntimeError("connection lost")
+
+    async def commit(self):
+        raise AssertionError("commit must not be reached")
+
+    async def rollback(self):
+        self.rolled_back = True
+
+
+@pytest.mark.anyio
+async def test_import_failure_returns_structured_error_result():
+    session = FailingSession()
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,100.00,0,0,0,100.00\n"
+        "C2,Beta LLC,,INV-2,2024-02-01,50.00,50.00,0,0,0,0,50.00\n"
+    )
+
+    result = await CSVImportService(session).import_csv_data(csv_content)
+
+    assert session.rolled_back
+    assert result.success is False
+    assert result.total_rows == 2
+    assert result.successful_rows == 0
+    assert result.failed_rows == 2
+    assert result.errors[0].row_number == 0
+    assert "connection lost" in result.errors[0].error_message
+
+
+@pytest.mark.anyio
+async def test_import_failure_before_any_row_is_read():
+    session = FailingSession()
+
+    # SET LOCAL fails before the first chunk is read
+    result = await CSVImportService(session, bulk_fast_commit=True).import_csv_data(CSV_HEADER)
+
+    assert result.success is False
+    assert result.total_rows == 0
+    assert result.failed_rows == 0
+    assert len(result.errors) == 1
+
+
+async def _count(session, model):
+    return await session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.anyio
+async def test_rejected_record_fails_only_its_row(db_session, monkeypatch):
+    # Two rows per chunk, so the account of the rejected row 2 shows up again in a later chunk
+    monkeypatch.setattr(csv_import_service, "IMPORT_CHUNK_SIZE", 2)
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,100.00,0,0,0,100.00\n"
+        # Fits the schema but overflows the DECIMAL(10, 2) columns
+        "C2,Beta LLC,ap@beta.com,INV-2,2024-02-01,123456789012.00,0,123456789012.00,0,0,0,123456789012.00\n"
+        "C1,Acme Corp,billing@acme.com,INV-3,2024-03-01,75.00,0,0,75.00,0,0,75.00\n"
+        "C3,Gamma Inc,ap@gamma.com,INV-4,2024-03-01,abc,0,0,0,0,0,10.00\n"
+        "C2,Beta LLC,ap@beta.com,INV-5,2024-01-20,60.00,0,60.00,0,0,0,60.00\n"
+    )
+
+    result = await CSVImportService(db_session).import_csv_data(csv_content)
+
+    assert result.success is False
+    assert result.total_rows == 5
+    assert result.successful_rows == 3
+    assert result.failed_rows == 2
+    assert sorted(error.row_number for error in result.errors) == [2, 4]
+    database_error = next(error for error in result.errors if error.row_number == 2)
+    assert database_error.error_message.startswith("Database error")
+    assert database_error.row_data["invoice_number"] == "INV-2"
+
+    assert result.accounts_created == 2
+    assert result.contacts_created == 2
+    assert result.invoices_created == 3
+    assert result.aging_snapshots_created == 3
+    assert await _count(db_session, Account) == 2
+    assert await _count(db_session, Contact) == 2
+    assert await _count(db_session, Invoice) == 3
+    assert await _count(db_session, InvoiceAgingSnapshot) == 3
+    invoice_numbers = set(await db_session.scalars(select(Invoice.invoice_number)))
+    assert invoice_numbers == {"INV-1", "INV-3", "INV-5"}
+
+
+@pytest.mark.anyio
+async def test_import_creates_accounts_contacts_invoices_and_snapshots(db_session):
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,jane.doe@acme.com,INV-1,2024-01-15,\"$1,200.00\",0,\"$1,200.00\",0,0,0,\"$1,200.00\"\n"
+        "C1,Acme Corp,jane.doe@acme.com,INV-2,2024-02-01,300.00,0,0,0,150.00,0,150.00\n"
+        "C2,Beta LLC,,INV-3,2024-03-01,50.00,50.00,0,0,0,0,50.00\n"
+    )
+
+    result = await CSVImportService(db_session).import_csv_data(csv_content)
+
+    assert result.success is True
+    assert (result.total_rows, result.successful_rows, result.failed_rows) == (3, 3, 0)
+    assert result.accounts_created == 2
+    assert result.contacts_created == 2
+    assert result.invoices_created == 3
+    assert result.invoices_updated == 0
+    assert result.aging_snapshots_created == 3
+    assert result.errors == []
+
+    assert await _count(db_session, Account) == 2
+    assert await _count(db_session, Contact) == 2
+    assert await _count(db_session, Invoice) == 3
+    assert await _count(db_session, InvoiceAgingSnapshot) == 3
+
+    contact = await db_session.scalar(select(Contact).where(Contact.email == "jane.doe@acme.com"))
+    assert (contact.first_name, contact.last_name) == ("Jane", "Doe")
+    invoice = await db_session.scalar(select(Invoice).where(Invoice.invoice_number == "INV-1"))
+    assert invoice.invoice_amount == Decimal("1200.00")
+    assert invoice.total_outstanding == Decimal("1200.00")
+
+    clients = {client.client_id: client for client in result.contact_ready_clients}
+    assert set(clients) == {"C1", "C2"}
+    assert clients["C1"].email_address == "jane.doe@acme.com"
+    assert clients["C1"].total_outstanding_across_invoices == Decimal("1350.00")
+    assert len(clients["C1"].invoice_aging_snapshots) == 2
+    assert clients["C1"].dnc_status is False
+    # No email means do not contact
+    assert clients["C2"].dnc_status is True
+
+
+@pytest.mark.anyio
+async def test_duplicate_invoice_numbers_update_the_invoice(db_session):
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,100.00,0,0,0,100.00\n"
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,40.00,0,0,0,40.00\n"
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,40.00,0,0,0,40.00\n"
+    )
+
+    result = await CSVImportService(db_session).import_csv_data(csv_content)
+
+    assert (result.total_rows, result.successful_rows, result.failed_rows) == (3, 3, 0)
+    assert result.accounts_created == 1
+    assert result.invoices_created == 1
+    assert result.invoices_updated == 1
+    # The repeated row matches the latest snapshot, so it adds none
+    assert result.aging_snapshots_created == 2
+
+    assert await _count(db_session, Invoice) == 1
+    assert await _count(db_session, InvoiceAgingSnapshot) == 2
+    invoice = await db_session.scalar(select(Invoice))
+    assert invoice.total_outstanding == Decimal("40.00")
+
+
+@pytest.mark.anyio
+async def test_reimport_finds_existing_records(db_session):
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,100.00,0,0,0,100.00\n"
+    )
+    await CSVImportService(db_session).import_csv_data(csv_content)
+
+    result = await CSVImportService(db_session).import_csv_data(csv_content)
+
+    assert (result.total_rows, result.successful_rows, result.failed_rows) == (1, 1, 0)
+    assert result.accounts_created == 0
+    assert result.invoices_created == 0
+    assert result.aging_snapshots_created == 0
+    assert result.contact_ready_clients == []
+    assert await _count(db_session, Account) == 1
+    assert await _count(db_session, InvoiceAgingSnapshot) == 1
+
+
+@pytest.mark.anyio
+async def test_bad_amounts_and_dates_are_reported_per_row(db_session):
+    csv_content = CSV_HEADER + (
+        "C1,Acme Corp,billing@acme.com,INV-1,2024-01-15,100.00,0,100.00,,,,100.00\n"
+        "C2,Beta LLC,ap@beta.com,INV-2,2024-01-15,abc,0,0,0,0,0,10.00\n"
+        "C3,Gamma Inc,ap@gamma.com,INV-3,2024-13-01,10.00,10.00,0,0,0,0,10.00\n"
+        "C4,Delta Co,ap@delta.com,INV-4,20240301,10.00,10.00,0,0,0,0,10.00\n"
+        "C5,Echo Ltd,ap@echo.com,INV-5,2024-3-5,10.00,10.00,0,0,0,0,10.00\n"
+    )
+
+    result = await CSVImportService(db_session).import_csv_data(csv_content)
+
+    assert result.success is False
+    assert (result.total_rows, result.successful_rows, result.failed_rows) == (5, 2, 3)
+    assert sorted(error.row_number for error in result.errors) == [2, 3, 4]
+    assert all(error.row_data for error in result.errors)
+
+    invoice_numbers = set(await db_session.scalars(select(Invoice.invoice_number)))
+    assert invoice_numbers == {"INV-1", "INV-5"}
+    assert await _count(db_session, Account) == 2
+    # Blank aging cells are imported as zero
+    snapshot = await db_session.scalar(
+        select(InvoiceAgingSnapshot).join(Invoice).where(Invoice.invoice_number == "INV-1")
+    )
+    assert snapshot.days_61_90 == Decimal("0")
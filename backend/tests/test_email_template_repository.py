@@ -0,0 +1,81 @@
+import pytest
+from sqlmodel import select
+
+from app.models.email_template import EmailTemplate
+from app.repositories.email_template import EmailTemplateRepository
+
+
+async def _versions(session, identifier):
+    """(version, is_active) pairs of a template as stored, oldest first."""
+    result = await session.execute(
+        select(EmailTemplate.version, EmailTemplate.is_active)
+        .where(EmailTemplate.identifier == identifier)
+        .order_by(EmailTemplate.version)
+        .execution_options(populate_existing=True)
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.anyio
+async def test_upsert_new_version_creates_first_version(db_session):
+    repository = EmailTemplateRepository(db_session)
+
+    template = await repository.upsert_new_version(
+        "ESCALATION_1", {"subject": "Hi", "body": "<p>Hi</p>"}, summary_json='{"identifier":"ESCALATION_1"}'
+    )
+    await db_session.commit()
+
+    assert template.version == 1
+    assert template.is_active is True
+    assert template.data == {"subject": "Hi", "body": "<p>Hi</p>"}
+    assert template.summary_json == '{"identifier":"ESCALATION_1"}'
+    assert template.id is not None
+    assert await _versions(db_session, "ESCALATION_1") == [(1, True)]
+
+
+@pytest.mark.anyio
+async def test_upsert_new_version_supersedes_the_active_version(db_session):
+    repository = EmailTemplateRepository(db_session)
+    await repository.upsert_new_version("ESCALATION_1", {"subject": "v1", "body": "one"})
+    await repository.upsert_new_version("OTHER", {"subject": "other", "body": "other"})
+
+    template = await repository.upsert_new_version("ESCALATION_1", {"subject": "v2", "body": "two"})
+    await db_session.commit()
+
+    assert template.version == 2
+    assert template.is_active is True
+    assert await _versions(db_session, "ESCALATION_1") == [(1, False), (2, True)]
+    # Other templates keep their active version
+    assert await _versions(db_session, "OTHER") == [(1, True)]
+    latest = await repository.get_latest_version("ESCALATION_1")
+    assert latest.data == {"subject": "v2", "body": "two"}
+
+
+@pytest.mark.anyio
+async def test_activate_version_reactivates_an_older_version(db_session):
+    repository = EmailTemplateRepository(db_session)
+    for number in range(1, 4):
+        await repository.upsert_new_version("ESCALATION_1", {"subject": f"v{number}", "body": "b"})
+
+    template, previous = await repository.activate_version("ESCALATION_1", 1)
+    await db_session.commit()
+
+    assert template.version == 1
+    assert template.is_active is True
+    assert template.data == {"subject": "v1", "body": "b"}
+    assert previous == 3
+    assert await _versions(db_session, "ESCALATION_1") == [(1, True), (2, False), (3, False)]
+
+
+@pytest.mark.anyio
+async def test_activate_missing_version_leaves_template_untouched(db_session):
+    repository = EmailTemplateRepository(db_session)
+    await repository.upsert_new_version("ESCALATION_1", {"subject": "v1", "body": "b"})
+    await repository.upsert_new_version("ESCALATION_1", {"subject": "v2", "body": "b"})
+
+    template, previous = await repository.activate_version("ESCALATION_1", 7)
+    await db_session.commit()
+
+    assert template is None
+    assert previous is None
+    assert await _versions(db_session, "ESCALATION_1") == [(1, False), (2, True)]
@@ -0,0 +1,179 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import aiosmtplib
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.escalation import (
+    EmailSendingDetailFailed,
+    EmailSendingDetailSent,
+    EscalationRequest,
+    EscalationResultPending,
+    EscalationResultSent,
+)
+from app.schemas.csv_import import ContactReadyClient
+from app.services import escalation_service
+from app.services.escalation_service import EscalationService
+
+
+class FakeEmailClient:
+    """Email client stand-in that answers each recipient from a script of outcomes."""
+
+    def __init__(self, outcomes=None, delays=None):
+        # Per recipient: exceptions to raise on successive attempts, then success
+        self.outcomes = outcomes or {}
+        self.delays = delays or {}
+        self.attempts = {}
+
+    async def send_email(self, to_email, subject, html_body):
+        attempt = self.attempts.get(to_email, 0)
+        self.attempts[to_email] = attempt + 1
+        await asyncio.sleep(self.delays.get(to_email, 0))
+
+        failures = self.outcomes.get(to_email, [])
+        if attempt < len(failures):
+            # Wrapped like SMTPEmailClient.send_email does
+            error = failures[attempt]
+            raise HTTPException(status_code=500, detail=f"Failed to send email: {error}") from error
+        return {
+            "status": "sent",
+            "message_id": f"<{to_email}>",
+            "to_email": to_email,
+            "sent_at": datetime(2024, 5, 1, 12, 0, 0)
+        }
+
+
+@pytest.fixture
+def fake_email_client(monkeypatch):
+    """Install a fake email client and take the waiting out of retries and pacing."""
+    def install(**kwargs):
+        client = FakeEmailClient(**kwargs)
+        monkeypatch.setattr(escalation_service, "email_client", client)
+        return client
+
+    monkeypatch.setattr(escalation_service, "EMAIL_RETRY_BASE_DELAY_SECONDS", 0)
+    monkeypatch.setattr(escalation_service, "EMAIL_SENDS_PER_SECOND", 10_000)
+    return install
+
+
+def _result(number: int) -> EscalationResultPending:
+    return EscalationResultPending.from_trusted(
+        account=f"Account {number}",
+        email_address=f"ap{number}@example.com",
+        email_subject=f"Overdue invoices {number}",
+        email_body="<p>Please pay</p>",
+        escalation_degree=1,
+        template_used="ESCALATION_LEVEL_1",
+        invoice_count=1,
+        total_outstanding=Decimal("100.00")
+    )
+
+
+def _request(retry_failed_emails: bool = True) -> EscalationRequest:
+    contact = ContactReadyClient(
+        client_id="C1",
+        account_name="Account 0",
+        email_address="ap0@example.com",
+        dnc_status=False,
+        total_outstanding_across_invoices=Decimal("0"),
+        invoice_aging_snapshots=[]
+    )
+    return EscalationRequest(contact_ready_clients=[contact], retry_failed_emails=retry_failed_emails)
+
+
+async def _send(results, request=None):
+    service = EscalationService(session=None)
+    return await service._send_escalation_emails(results, {}, request or _request())
+
+
+@pytest.mark.anyio
+async def test_details_keep_input_order_when_sends_finish_out_of_order(fake_email_client):
+    results = [_result(number) for number in range(4)]
+    # Earlier emails take longer, so they complete last
+    fake_email_client(delays={
+        result.email_address: 0.04 - 0.01 * number for number, result in enumerate(results)
+    })
+
+    summary, details = await _send(results)
+
+    assert [detail.email_address for detail in details] == [r.email_address for r in results]
+    assert [detail.email_message_id for detail in details] == [f"<{r.email_address}>" for r in results]
+    assert summary.successful_sends == 4
+    assert summary.failed_sends == 0
+
+
+@pytest.mark.anyio
+async def test_transient_errors_are_retried(fake_email_client):
+    results = [_result(1)]
+    client = fake_email_client(outcomes={
+        "ap1@example.com": [
+            aiosmtplib.SMTPServerDisconnected("Connection lost"),
+            aiosmtplib.SMTPResponseException(421, "Service not available"),
+        ]
+    })
+
+    summary, details = await _send(results)
+
+    assert client.attempts["ap1@example.com"] == 3
+    assert summary.successful_sends == 1
+    assert isinstance(details[0], EmailSendingDetailSent)
+
+
+@pytest.mark.anyio
+async def test_permanent_errors_are_not_retried(fake_email_client):
+    results = [_result(1)]
+    client = fake_email_client(outcomes={
+        "ap1@example.com": [aiosmtplib.SMTPResponseException(550, "No such user")]
+    })
+
+    summary, details = await _send(results)
+
+    assert client.attempts["ap1@example.com"] == 1
+    assert summary.failed_sends == 1
+    assert isinstance(details[0], EmailSendingDetailFailed)
+    assert "No such user" in details[0].email_send_error
+
+
+@pytest.mark.anyio
+async def test_retries_stop_when_disabled(fake_email_client):
+    results = [_result(1)]
+    client = fake_email_client(outcomes={
+        "ap1@example.com": [aiosmtplib.SMTPServerDisconnected("Connection lost")]
+    })
+
+    summary, _ = await _send(results, _request(retry_failed_emails=False))
+
+    assert client.attempts["ap1@example.com"] == 1
+    assert summary.failed_sends == 1
+
+
+@pytest.mark.anyio
+async def test_sent_and_failed_results_use_their_own_models(fake_email_client):
+    results = [_result(1), _result(2)]
+    fake_email_client(outcomes={
+        "ap2@example.com": [aiosmtplib.SMTPResponseException(550, "Mailbox unavailable")]
+    })
+
+    summary, details = await _send(results)
+
+    assert (summary.total_attempts, summary.successful_sends, summary.failed_sends) == (2, 1, 1)
+
+    sent, failed = details
+    assert isinstance(sent, EmailSendingDetailSent)
+    assert sent.email_sent is True
+    assert sent.email_sent_at == datetime(2024, 5, 1, 12, 0, 0)
+    assert sent.account_id == "Account 1"
+    assert isinstance(failed, EmailSendingDetailFailed)
+    assert failed.email_sent is False
+
+    # The escalation results are replaced in place with their outcome
+    assert isinstance(results[0], EscalationResultSent)
+    assert results[0].email_message_id == "<ap1@example.com>"
+    assert isinstance(results[1], EscalationResultPending)
+    assert "Mailbox unavailable" in results[1].email_send_error
+
+    # Both detail kinds serialize under the discriminator
+    assert sent.model_dump()["email_sent"] is True
+    assert failed.model_dump()["email_sent"] is False
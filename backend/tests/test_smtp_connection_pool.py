@@ -0,0 +1,178 @@
+from email.mime.multipart import MIMEMultipart
+
+import aiosmtplib
+import pytest
+from fastapi import FastAPI
+
+from app import main
+from app.external import email_client as email_client_module
+from app.external.email_client import SMTPEmailClient
+
+
+class FakeSMTP:
+    """aiosmtplib.SMTP stand-in that records the connections opened and how they end."""
+
+    instances = []
+    # Failures every newly opened connection starts with
+    initial_send_failures = []
+
+    def __init__(self, hostname, port, use_tls):
+        self.is_connected = False
+        self.sent = 0
+        self.quit_called = False
+        self.closed = False
+        # Exceptions raised by the next send_message calls, in order
+        self.send_failures = list(self.initial_send_failures)
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def login(self, username, password):
+        pass
+
+    async def send_message(self, message):
+        if self.send_failures:
+            error = self.send_failures.pop(0)
+            if isinstance(error, aiosmtplib.SMTPServerDisconnected):
+                self.is_connected = False
+            raise error
+        self.sent += 1
+        return {}, f"Ok message-{len(FakeSMTP.instances)}-{self.sent}"
+
+    async def quit(self):
+        self.quit_called = True
+        self.is_connected = False
+
+    def close(self):
+        self.closed = True
+        self.is_connected = False
+
+
+class FakeClock:
+    """Monotonic clock the tests move forward by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(email_client_module.aiosmtplib, "SMTP", FakeSMTP)
+    fake_clock = FakeClock()
+    monkeypatch.setattr(email_client_module, "time", fake_clock)
+    return fake_clock
+
+
+def _message() -> MIMEMultipart:
+    message = MIMEMultipart("alternative")
+    message["To"] = "ap@example.com"
+    message["Subject"] = "Overdue invoices"
+    return message
+
+
+@pytest.mark.anyio
+async def test_connection_is_reused_between_sends(clock):
+    client = SMTPEmailClient()
+
+    first = await client._send_smtp_message(_message())
+    clock.now += 1
+    second = await client._send_smtp_message(_message())
+
+    assert len(FakeSMTP.instances) == 1
+    assert FakeSMTP.instances[0].sent == 2
+    assert first["message_id"] == "message-1-1"
+    assert second["message_id"] == "message-1-2"
+    assert len(client._idle_connections) == 1
+
+
+@pytest.mark.anyio
+async def test_idle_connection_past_timeout_is_replaced(clock):
+    client = SMTPEmailClient()
+    await client._send_smtp_message(_message())
+
+    clock.now += email_client_module.SMTP_IDLE_TIMEOUT_SECONDS
+    await client._send_smtp_message(_message())
+
+    stale, fresh = FakeSMTP.instances
+    assert stale.quit_called
+    assert stale.sent == 1
+    assert fresh.sent == 1
+    assert [connection for connection, _ in client._idle_connections] == [fresh]
+
+
+@pytest.mark.anyio
+async def test_dropped_pooled_connection_is_retried_once_on_a_new_one(clock):
+    client = SMTPEmailClient()
+    await client._send_smtp_message(_message())
+    pooled = FakeSMTP.instances[0]
+    pooled.send_failures.append(aiosmtplib.SMTPServerDisconnected("Server disconnected"))
+
+    result = await client._send_smtp_message(_message())
+
+    assert pooled.closed
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].sent == 1
+    assert result["message_id"] == "message-2-1"
+
+
+@pytest.mark.anyio
+async def test_disconnect_on_fresh_connection_is_not_retried(clock, monkeypatch):
+    client = SMTPEmailClient()
+    monkeypatch.setattr(
+        FakeSMTP, "initial_send_failures", [aiosmtplib.SMTPServerDisconnected("Server disconnected")]
+    )
+
+    with pytest.raises(aiosmtplib.SMTPServerDisconnected):
+        await client._send_smtp_message(_message())
+
+    assert len(FakeSMTP.instances) == 1
+    assert client._idle_connections == []
+
+
+@pytest.mark.anyio
+async def test_retry_failure_closes_the_new_connection(clock, monkeypatch):
+    client = SMTPEmailClient()
+    await client._send_smtp_message(_message())
+    FakeSMTP.instances[0].send_failures.append(aiosmtplib.SMTPServerDisconnected("Server disconnected"))
+    monkeypatch.setattr(
+        FakeSMTP, "initial_send_failures", [aiosmtplib.SMTPResponseException(554, "Rejected")]
+    )
+
+    with pytest.raises(aiosmtplib.SMTPResponseException):
+        await client._send_smtp_message(_message())
+
+    # Only one retry: the original connection plus one replacement
+    assert len(FakeSMTP.instances) == 2
+    assert FakeSMTP.instances[1].quit_called
+    assert client._idle_connections == []
+
+
+@pytest.mark.anyio
+async def test_close_quits_idle_connections(clock):
+    client = SMTPEmailClient()
+    await client._send_smtp_message(_message())
+
+    await client.close()
+
+    assert FakeSMTP.instances[0].quit_called
+    assert client._idle_connections == []
+
+
+@pytest.mark.anyio
+async def test_application_shutdown_closes_the_pool(clock, monkeypatch):
+    client = SMTPEmailClient()
+    await client._send_smtp_message(_message())
+    monkeypatch.setattr(main, "email_client", client)
+    # Keep startup away from the database
+    monkeypatch.setattr(main.settings, "environment", "test")
+
+    async with main.lifespan(FastAPI()):
+        assert len(client._idle_connections) == 1
+
+    assert FakeSMTP.instances[0].quit_called
+    assert client._idle_connections == []